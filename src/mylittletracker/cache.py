@@ -0,0 +1,182 @@
+"""On-disk cache of successful provider HTTP responses.
+
+Tracking data changes every few hours at most, so re-running the CLI within a
+few minutes can be answered from disk. Entries are keyed by method, URL, query
+parameters and a digest of the request headers (so responses fetched with
+another API key or Accept-Language are kept apart) and stored under $XDG_CACHE_HOME/mylittletracker (override
+with MLT_CACHE_DIR; set MLT_NO_CACHE=1 to disable).
+
+Each entry is one file: a JSON metadata line followed by the raw body bytes.
+MemoryCache keeps already-parsed results in process for repeat lookups.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Mapping, Optional
+
+import httpx
+
+# Response headers worth replaying from the cache
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+# Process-wide lookup counters, see cache_stats()
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(outcome: str) -> None:
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def cache_stats() -> dict[str, int]:
+    """Hit/miss counts of fresh-entry lookups in this process."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def cache_dir() -> str:
+    """Directory holding cached responses (may not exist yet)."""
+    explicit = os.getenv("MLT_CACHE_DIR")
+    if explicit:
+        return explicit
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "mylittletracker")
+
+
+class ResponseCache:
+    """File-per-entry response cache with age checks on read."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        # Hashed so credentials never end up in the entry's metadata line
+        header_items = sorted((k.lower(), v) for k, v in (headers or {}).items())
+        header_digest = hashlib.sha256(repr(header_items).encode()).hexdigest()
+        return f"{method.upper()} {url} {items!r} {header_digest}"
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.bin")
+
+    def get(
+        self, key: str, *, max_age: float, count: bool = True
+    ) -> Optional[httpx.Response]:
+        """Return the cached response for key if younger than max_age seconds.
+
+        count=False keeps the lookup out of cache_stats().
+        """
+        try:
+            with open(self._path(key), "rb") as fh:
+                meta = json.loads(fh.readline())
+                if time.time() - meta["stored_at"] > max_age or meta["key"] != key:
+                    if count:
+                        _count("misses")
+                    return None
+                body = fh.read()
+        except (OSError, ValueError, KeyError):
+            if count:
+                _count("misses")
+            return None
+        if count:
+            _count("hits")
+        return httpx.Response(
+            meta["status"],
+            headers=meta["headers"],
+            content=body,
+            request=httpx.Request(meta["method"], meta["url"]),
+        )
+
+    def set(self, key: str, response: httpx.Response) -> None:
+        """Store response under key; failures to write are ignored."""
+        headers = {
+            h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers
+        }
+        meta = {
+            "key": key,
+            "stored_at": time.time(),
+            "status": response.status_code,
+            "method": response.request.method,
+            "url": str(response.request.url),
+            "headers": headers,
+        }
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, "wb") as fh:
+                fh.write(json.dumps(meta).encode())
+                fh.write(b"\n")
+                fh.write(response.content)
+            # Atomic swap so concurrent readers never see a partial entry
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def caching_disabled() -> bool:
+    """True when MLT_NO_CACHE=1 turns all caching off."""
+    return os.getenv("MLT_NO_CACHE") == "1"
+
+
+def default_cache() -> Optional[ResponseCache]:
+    """The cache configured by the environment, or None when disabled."""
+    if caching_disabled():
+        return None
+    return ResponseCache(cache_dir())
+
+
+class MemoryCache:
+    """Thread-safe in-process map with per-entry TTL and LRU eviction."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Value stored under key, or None if missing, expired or disabled."""
+        if caching_disabled():
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if caching_disabled():
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
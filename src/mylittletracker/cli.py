@@ -1,60 +1,143 @@
 import argparse
+import functools
 import json
-from typing import Callable, Optional
-from datetime import datetime
+import sys
+from typing import Any, Callable, Optional
 
-import httpx
 import os
-from dotenv import load_dotenv, find_dotenv
+
+try:  # Optional fast JSON encoder (pip install mylittletracker[fast])
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 from .models import TrackingResponse, Shipment, TrackingEvent, ShipmentStatus
-from .providers import REGISTRY as PROVIDER_REGISTRY, get_provider_names
-from .utils import normalize_language
+from .providers import REGISTRY, get_provider_names
+
+# Carrier name -> track(); provider modules (and their httpx/parsing
+# dependencies) are only imported once selected.
+PROVIDERS = REGISTRY
+_PROVIDER_CHOICES: tuple[str, ...] = tuple(get_provider_names())
+
+
+def _find_dotenv() -> Optional[str]:
+    """Locate .env in the working directory or its parents (like find_dotenv)."""
+    path = os.getcwd()
+    while True:
+        candidate = os.path.join(path, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _load_dotenv() -> None:
+    """Load environment variables from .env if present (prefer MLT_DOTENV_PATH).
+
+    python-dotenv is only imported when there is a file to load.
+    """
+    if os.environ.get("MLT_SKIP_DOTENV") == "1":
+        return
+    dotenv_path = os.getenv("MLT_DOTENV_PATH") or _find_dotenv()
+    if not dotenv_path or not os.path.isfile(dotenv_path):
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv(dotenv_path)
 
-# Load environment variables from .env if present (prefer project .env or MLT_DOTENV_PATH)
-_dotenv_path = os.getenv("MLT_DOTENV_PATH") or find_dotenv(usecwd=True)
-load_dotenv(_dotenv_path or None)
 
-# Map carrier name to its tracking function
-PROVIDERS: dict[str, Callable[..., TrackingResponse]] = PROVIDER_REGISTRY
+def _resolve(carrier: str) -> Callable[..., TrackingResponse]:
+    return PROVIDERS[carrier]
+
+
+def _track_one(
+    tracker: Callable[..., TrackingResponse],
+    carrier: str,
+    code: str,
+    language: str,
+    strict: bool,
+) -> tuple[TrackingResponse, bool]:
+    """Track a single code; returns (response, error_occurred)."""
+    if strict:
+        # In strict mode, propagate errors
+        return tracker(code, language=language), False
+    try:
+        return tracker(code, language=language), False
+    except Exception as exc:  # Fallback to normalized UNKNOWN response on errors
+        return _fallback_response(carrier, code, exc), True
 
 
 def cmd_track(args: argparse.Namespace) -> int:
-    tracker = PROVIDERS[args.carrier]
+    # utils pulls in httpx; only load it once a provider is actually queried
+    from .utils import normalize_language
+
+    tracker = _resolve(args.carrier)
     # Normalize language globally per provider
     lang_norm, lang_from = normalize_language(args.language, args.carrier)
-    error_occurred = False
-    if args.strict:
-        # In strict mode, propagate errors
-        tracking_response = tracker(args.code, language=lang_norm)
+    codes: list[str] = args.code
+
+    def run(code: str) -> tuple[TrackingResponse, bool]:
+        return _track_one(tracker, args.carrier, code, lang_norm, args.strict)
+
+    if len(codes) == 1:
+        results = [run(codes[0])]
     else:
-        try:
-            tracking_response = tracker(args.code, language=lang_norm)
-        except Exception as exc:  # Fallback to normalized UNKNOWN response on errors
-            tracking_response = _fallback_response(args.carrier, args.code, exc)
-            error_occurred = True
+        # Provider calls are I/O bound; query several codes concurrently
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(codes))) as pool:
+            results = list(pool.map(run, codes))
+
+    error_occurred = any(failed for _, failed in results)
+    if len(results) == 1:
+        tracking_response = results[0][0]
+    else:
+        tracking_response = TrackingResponse(
+            shipments=[s for resp, _ in results for s in resp.shipments],
+            provider=args.carrier,
+        )
     # If language normalization happened and not JSON output, emit a small note when verbose
     if args.verbose and (not args.json) and lang_from and (lang_from != lang_norm):
         print(
             f"Note: normalized language '{lang_from}' -> '{lang_norm}' for {args.carrier}"
         )
     if args.json:
-        # Convert Pydantic model to JSON (compat across Pydantic v1/v2)
-        try:
-            print(tracking_response.model_dump_json(indent=2))  # Pydantic v2
-        except AttributeError:
-            print(tracking_response.json(indent=2))  # Pydantic v1
+        # Write UTF-8 bytes straight to the binary stream (no str round-trip)
+        if orjson is not None:
+            data = orjson.dumps(
+                tracking_response.model_dump(mode="json"),
+                option=orjson.OPT_INDENT_2,
+            )
+        else:
+            data = tracking_response.model_dump_json(indent=2).encode()
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            # Text-only stdout (redirect_stdout(StringIO()), some IDE consoles)
+            sys.stdout.write(data.decode() + "\n")
+        else:
+            sys.stdout.flush()
+            out.write(data)
+            out.write(b"\n")
+            out.flush()
     else:
         print_human(tracking_response)
     return 1 if (not args.strict and error_occurred) else 0
 
 
 def cmd_providers(_args: argparse.Namespace) -> int:
-    for name in sorted(PROVIDERS):
+    for name in _PROVIDER_CHOICES:
         print(name)
     return 0
 
 
 def _fallback_response(carrier: str, code: str, exc: Exception) -> TrackingResponse:
+    # Only needed on the error path; keep them off CLI startup
+    from datetime import datetime
+
+    import httpx
+
     # Build a minimal normalized response with an explanatory event
     status_code: Optional[str] = None
     status_text = "Error during tracking"
@@ -62,9 +145,12 @@ def _fallback_response(carrier: str, code: str, exc: Exception) -> TrackingRespo
     ev_extras: dict[str, object] = {}
 
     if isinstance(exc, httpx.HTTPStatusError):
+        # Read each response attribute once; httpx computes some on access
         resp = exc.response
-        status_code = str(resp.status_code)
-        status_text = f"HTTP {resp.status_code} while fetching"
+        sc = resp.status_code
+        headers = resp.headers
+        status_code = str(sc)
+        status_text = f"HTTP {sc} while fetching"
 
         url_text: Optional[str] = None
         try:
@@ -77,13 +163,18 @@ def _fallback_response(carrier: str, code: str, exc: Exception) -> TrackingRespo
         provider_error_desc: Optional[str] = None
         body_snippet: Optional[str] = None
         try:
-            ctype = (
-                resp.headers.get("Content-Type")
-                or resp.headers.get("content-type")
-                or ""
-            ).lower()
+            # httpx.Headers lookups are case-insensitive
+            ctype = (headers.get("content-type") or "").lower()
+            # Only the head of the body is inspected, so a huge error page or
+            # payload can't make the fallback path expensive
+            raw = resp.content[:4096]
+            body: Any = None
             if "json" in ctype:
-                body = resp.json()
+                try:
+                    body = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                except ValueError:
+                    body = None
+            if isinstance(body, dict):
                 # Try common fields
                 provider_error_code = (
                     str(
@@ -105,12 +196,18 @@ def _fallback_response(carrier: str, code: str, exc: Exception) -> TrackingRespo
                 )
                 if not provider_error_desc:
                     try:
-                        body_snippet = json.dumps(body)[:500]
+                        if orjson is not None:
+                            body_snippet = orjson.dumps(body)[:500].decode(
+                                errors="replace"
+                            )
+                        else:
+                            body_snippet = json.dumps(body)[:500]
                     except Exception:
                         body_snippet = str(body)[:500]
-            else:
-                txt = resp.text or ""
-                body_snippet = txt[:500] if txt else None
+            elif raw:
+                body_snippet = raw[:500].decode(
+                    resp.encoding or "utf-8", errors="replace"
+                )
         except Exception:
             pass
 
@@ -140,13 +237,15 @@ def _fallback_response(carrier: str, code: str, exc: Exception) -> TrackingRespo
         except Exception:
             pass
 
-    shipment = Shipment(
+    # Inputs are built right here, so skip pydantic validation
+    now = datetime.now()
+    shipment = Shipment.model_construct(
         tracking_number=code,
         carrier=carrier,
         status=ShipmentStatus.UNKNOWN,
         events=[
-            TrackingEvent(
-                timestamp=datetime.now(),
+            TrackingEvent.model_construct(
+                timestamp=now,
                 status=status_text,
                 location=None,
                 details=details,
@@ -161,23 +260,29 @@ def _fallback_response(carrier: str, code: str, exc: Exception) -> TrackingRespo
         actual_delivery=None,
         extras=None,
     )
-    return TrackingResponse(shipments=[shipment], provider=carrier)
+    return TrackingResponse.model_construct(
+        shipments=[shipment], provider=carrier, query_timestamp=now
+    )
 
 
 def print_human(tracking_response: TrackingResponse) -> None:
-    print(f"Provider: {tracking_response.provider}")
+    # Collect lines and emit them with a single write
+    parts: list[str] = [f"Provider: {tracking_response.provider}"]
 
     if not tracking_response.has_shipments:
-        print("No shipments found")
+        parts.append("No shipments found")
+        sys.stdout.write("\n".join(parts) + "\n")
         return
 
     for shipment in tracking_response.shipments:
-        print(f"\nShipment: {shipment.tracking_number}")
-        print(f"Carrier: {shipment.carrier}")
+        parts.append(f"\nShipment: {shipment.tracking_number}")
+        parts.append(f"Carrier: {shipment.carrier}")
+        status = shipment.status
+        events = shipment.events
         # Status line; if unknown, show latest raw status/code for clarity
-        status_line = f"Status: {shipment.status.value}"
-        if shipment.status.name == "UNKNOWN" and shipment.events:
-            latest = shipment.events[-1]
+        status_line = f"Status: {status.value}"
+        if status.name == "UNKNOWN" and events:
+            latest = events[-1]
             extra_bits = []
             if latest.status:
                 extra_bits.append(latest.status)
@@ -185,61 +290,106 @@ def print_human(tracking_response: TrackingResponse) -> None:
                 extra_bits.append(f"code={latest.status_code}")
             if extra_bits:
                 status_line += f" (latest: {'; '.join(extra_bits)})"
-        print(status_line)
+        parts.append(status_line)
 
         # Show additional info if available
         if shipment.service_type:
-            print(f"Service: {shipment.service_type}")
+            parts.append(f"Service: {shipment.service_type}")
         if shipment.origin:
-            print(f"Origin: {shipment.origin}")
+            parts.append(f"Origin: {shipment.origin}")
         if shipment.destination:
-            print(f"Destination: {shipment.destination}")
+            parts.append(f"Destination: {shipment.destination}")
 
         # Show events
-        if not shipment.events:
-            print("No tracking events")
+        if not events:
+            parts.append("No tracking events")
         else:
-            print("\nTracking Events:")
-            for event in shipment.events:
-                timestamp = event.timestamp.strftime("%Y-%m-%d %H:%M")
-                print(f"- {timestamp}: {event.status}")
-                if event.location:
-                    print(f"  Location: {event.location}")
-                if event.details:
-                    print(f"  Details: {event.details}")
+            parts.append("\nTracking Events:")
+            append = parts.append
+            for event in events:
+                t = event.timestamp
+                location = event.location
+                details = event.details
+                timestamp = f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}"
+                append(f"- {timestamp}: {event.status}")
+                if location:
+                    append(f"  Location: {location}")
+                if details:
+                    append(f"  Details: {details}")
 
+    sys.stdout.write("\n".join(parts) + "\n")
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="mylittletracker", description="Personal parcels tracking CLI."
-    )
-    subparsers = parser.add_subparsers(dest="command")
 
-    p_track = subparsers.add_parser("track", help="Track a parcel")
-    p_track.add_argument("carrier", choices=get_provider_names(), help="Carrier name")
-    p_track.add_argument("code", help="Parcel/shipment code")
+def _carrier(value: str) -> str:
+    """argparse type= validator; avoids materializing a choices list per parser."""
+    if value not in PROVIDERS:
+        raise argparse.ArgumentTypeError(
+            f"invalid choice: {value!r} (choose from {', '.join(_PROVIDER_CHOICES)})"
+        )
+    return value
+
+
+def _add_track_arguments(p_track: argparse.ArgumentParser, with_help: bool) -> None:
+    # Help text is only attached when it will be shown (-h/--help)
+    def h(text: str) -> Optional[str]:
+        return text if with_help else None
+
+    p_track.add_argument("carrier", type=_carrier, help=h("Carrier name"))
+    p_track.add_argument(
+        "code",
+        nargs="+",
+        help=h("Parcel/shipment code(s); several are tracked concurrently"),
+    )
     p_track.add_argument(
         "--language",
         "-l",
         default=None,
-        help=(
+        help=h(
             "Language (two-letter code like en, es, de, fr, it, nl). "
             "If omitted, defaults to $MLT_DEFAULT_LANGUAGE or system locale (fallback en). "
             "Other forms (e.g., en-US) are accepted and normalized per provider."
         ),
     )
-    p_track.add_argument("--json", action="store_true", help="Output raw JSON payload")
+    p_track.add_argument(
+        "--json", action="store_true", help=h("Output raw JSON payload")
+    )
     p_track.add_argument(
         "--strict",
         action="store_true",
-        help="Propagate errors (non-zero exit) instead of returning fallback",
+        help=h("Propagate errors (non-zero exit) instead of returning fallback"),
     )
     p_track.add_argument(
         "--verbose",
         "-v",
         action="store_true",
-        help="Print normalization notes and extra info",
+        help=h("Print normalization notes and extra info"),
     )
+
+
+# Subcommands, in help order
+_COMMANDS = ("track", "providers")
+
+
+@functools.lru_cache(maxsize=2 * (len(_COMMANDS) + 1))
+def build_parser(
+    command: Optional[str] = None, with_help: bool = True
+) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    Subcommands are always registered (so top-level help lists them), but only
+    the arguments of `command` are added; pass None for the top-level parser.
+    With with_help=False the subcommand arguments carry no help text.
+    The result is memoized per (command, with_help) for repeated in-process
+    main() calls; use build_parser.cache_clear() to rebuild.
+    """
+    parser = argparse.ArgumentParser(
+        prog="mylittletracker", description="Personal parcels tracking CLI."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    p_track = subparsers.add_parser("track", help="Track a parcel")
+    if command == "track":
+        _add_track_arguments(p_track, with_help)
     p_track.set_defaults(func=cmd_track)
 
     p_prov = subparsers.add_parser("providers", help="List supported carriers")
@@ -249,7 +399,13 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main(argv: Optional[list[str]] = None) -> int:
-    parser = build_parser()
+    _load_dotenv()
+    if argv is None:
+        argv = sys.argv[1:]
+    # Peek at the subcommand so only its arguments get constructed
+    command = argv[0] if argv and argv[0] in _COMMANDS else None
+    with_help = "-h" in argv or "--help" in argv
+    parser = build_parser(command, with_help)
     args = parser.parse_args(argv)
     if not getattr(args, "command", None):
         parser.print_help()
@@ -4,10 +4,27 @@ Universal Pydantic models for shipment tracking data.
 These models provide a common interface for tracking data from different providers.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, ConfigDict, field_serializer
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_serializer
+
+
+def to_utc(dt: datetime) -> datetime:
+    """Ensure a datetime is timezone-aware UTC.
+
+    If the datetime is naive (no tzinfo), assume it is UTC and attach tzinfo=UTC.
+    If it is aware, convert to UTC.
+    """
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def serialize_dt(dt: datetime) -> str:
+    """Serialize datetime as ISO-8601 with trailing 'Z' for UTC."""
+    return to_utc(dt).isoformat().replace("+00:00", "Z")
 
 
 class ShipmentStatus(str, Enum):
@@ -43,11 +60,20 @@ class TrackingEvent(BaseModel):
 
     @field_serializer("timestamp")
     def _ser_timestamp(self, dt: datetime) -> str:
-        from .utils import serialize_dt
-
         return serialize_dt(dt)
 
-    model_config = ConfigDict()
+    # Build the validator/serializer on first use rather than at import time
+    model_config = ConfigDict(defer_build=True)
+
+
+@lru_cache(maxsize=None)
+def event_list_adapter() -> TypeAdapter[List[TrackingEvent]]:
+    """Validator for a whole list of events, built once on first use.
+
+    Validating raw event dicts in one call is cheaper than constructing each
+    TrackingEvent separately.
+    """
+    return TypeAdapter(List[TrackingEvent])
 
 
 class Shipment(BaseModel):
@@ -77,23 +103,12 @@ class Shipment(BaseModel):
         description="Provider-specific extra metadata for this shipment",
     )
 
-    @field_serializer("estimated_delivery")
-    def _ser_estimated(self, dt: Optional[datetime]) -> Optional[str]:
-        if dt is None:
-            return None
-        from .utils import serialize_dt
-
-        return serialize_dt(dt)
+    @field_serializer("estimated_delivery", "actual_delivery")
+    def _ser_delivery(self, dt: Optional[datetime]) -> Optional[str]:
+        return None if dt is None else serialize_dt(dt)
 
-    @field_serializer("actual_delivery")
-    def _ser_actual(self, dt: Optional[datetime]) -> Optional[str]:
-        if dt is None:
-            return None
-        from .utils import serialize_dt
-
-        return serialize_dt(dt)
-
-    model_config = ConfigDict()
+    # Validator/serializer built on first use, as for TrackingEvent
+    model_config = ConfigDict(defer_build=True)
 
 
 class TrackingResponse(BaseModel):
@@ -107,8 +122,6 @@ class TrackingResponse(BaseModel):
 
     @field_serializer("query_timestamp")
     def _ser_query_ts(self, dt: datetime) -> str:
-        from .utils import serialize_dt
-
         return serialize_dt(dt)
 
     @property
@@ -121,4 +134,5 @@ class TrackingResponse(BaseModel):
         """Get the first (primary) shipment if available."""
         return self.shipments[0] if self.shipments else None
 
-    model_config = ConfigDict()
+    # Validator/serializer built on first use, as for TrackingEvent
+    model_config = ConfigDict(defer_build=True)
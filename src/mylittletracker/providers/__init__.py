@@ -2,31 +2,71 @@
 
 Expose a simple mapping from provider name to its track() callable, so the CLI
 and other clients can register providers in one place.
+
+Provider modules are imported on first use, so listing providers or tracking
+with one carrier does not pay for importing the others.
 """
 
 from __future__ import annotations
 
-from typing import Callable
+import importlib
+from collections.abc import Iterator, Mapping
+from typing import Any, Callable
 
 from ..models import TrackingResponse
 
-# Import provider modules to populate the registry
-from . import correos as _correos
-from . import dhl as _dhl
-from . import dpd as _dpd
-from . import gls as _gls
-from . import ctt as _ctt
-from . import ecoscooting as _ecoscooting
-
-REGISTRY: dict[str, Callable[..., TrackingResponse]] = {
-    "correos": _correos.track,
-    "ctt": _ctt.track,
-    "dhl": _dhl.track,
-    "dpd": _dpd.track,
-    "gls": _gls.track,
-    "ecoscooting": _ecoscooting.track,
+# Provider name -> "module:attribute" of its track() callable
+_LAZY: dict[str, str] = {
+    "correos": "mylittletracker.providers.correos:track",
+    "ctt": "mylittletracker.providers.ctt:track",
+    "dhl": "mylittletracker.providers.dhl:track",
+    "dpd": "mylittletracker.providers.dpd:track",
+    "gls": "mylittletracker.providers.gls:track",
+    "ecoscooting": "mylittletracker.providers.ecoscooting:track",
 }
 
 
+def _load(name: str) -> Callable[..., TrackingResponse]:
+    module_name, _, attr = _LAZY[name].partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class _LazyRegistry(Mapping[str, Callable[..., TrackingResponse]]):
+    """Read-only name -> track() mapping that imports providers on access."""
+
+    def __init__(self) -> None:
+        self._loaded: dict[str, Callable[..., TrackingResponse]] = {}
+
+    def __getitem__(self, name: str) -> Callable[..., TrackingResponse]:
+        try:
+            return self._loaded[name]
+        except KeyError:
+            if name not in _LAZY:
+                raise
+        fn = self._loaded[name] = _load(name)
+        return fn
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_LAZY)
+
+    def __len__(self) -> int:
+        return len(_LAZY)
+
+    def __contains__(self, name: object) -> bool:
+        return name in _LAZY
+
+
+REGISTRY: Mapping[str, Callable[..., TrackingResponse]] = _LazyRegistry()
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: `providers.dhl` attribute access imports the submodule on demand
+    if name in _LAZY:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_provider_names() -> list[str]:
-    return sorted(REGISTRY.keys())
+    return sorted(_LAZY)
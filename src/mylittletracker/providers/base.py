@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-
-import httpx
+from functools import cached_property
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
 
 from ..models import TrackingResponse
-from ..utils import get_with_retries, async_get_with_retries
+
+if TYPE_CHECKING:
+    import httpx
+
+# httpx and the HTTP helpers in ..utils are imported where requests are made,
+# so subclasses can be imported for URL building without loading them.
 
 
 class MissingCredentialsError(RuntimeError):
@@ -37,6 +42,8 @@ class ProviderBase(ABC):
     timeout: float = 20.0
     user_agent: str = "mylittletracker/0.1 (+https://example.com)"
     default_language: str = "en"
+    # Seconds a successful GET is served from the on-disk cache (None disables)
+    cache_ttl: Optional[float] = 300.0
 
     # Optional public tracking website base. Subclasses may override and
     # implement build_tracking_url accordingly.
@@ -83,14 +90,26 @@ class ProviderBase(ABC):
         return None
 
     # --- Helpers ---
+    @cached_property
+    def _default_headers(self) -> Mapping[str, str]:
+        return MappingProxyType(
+            {"User-Agent": self.user_agent, "Accept": "application/json"}
+        )
+
     def build_headers(
         self,
         *,
         accept: str = "application/json",
         extra: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, str]:
-        """Construct default headers with optional extra fields."""
-        headers = {"User-Agent": self.user_agent, "Accept": accept}
+    ) -> Mapping[str, str]:
+        """Construct default headers with optional extra fields.
+
+        The plain default is a shared read-only mapping; copy it before
+        modifying.
+        """
+        if accept == "application/json" and not extra:
+            return self._default_headers
+        headers = {**self._default_headers, "Accept": accept}
         if extra:
             headers.update(extra)
         return headers
@@ -100,11 +119,21 @@ class ProviderBase(ABC):
         url: str,
         *,
         params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> httpx.Response:
-        """HTTP GET with retries/timeouts via shared utility."""
+        """HTTP GET with retries/timeouts via shared utility.
+
+        Raises ProviderHTTPError without a request while the host's circuit
+        breaker is open (see utils.breaker_for()).
+        """
+        from ..utils import get_with_retries
+
         return get_with_retries(
-            url, params=params, headers=headers, timeout=self.timeout
+            url,
+            params=params,
+            headers=headers,
+            timeout=self.timeout,
+            cache_ttl=self.cache_ttl,
         )
 
     async def aget(
@@ -112,12 +141,19 @@ class ProviderBase(ABC):
         url: str,
         *,
         params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
         client: Optional[httpx.AsyncClient] = None,
     ) -> httpx.Response:
-        """Async HTTP GET with retries/timeouts via shared utility."""
+        """Async HTTP GET with retries/timeouts via shared utility (see get())."""
+        from ..utils import async_get_with_retries
+
         return await async_get_with_retries(
-            url, params=params, headers=headers, timeout=self.timeout, client=client
+            url,
+            params=params,
+            headers=headers,
+            timeout=self.timeout,
+            client=client,
+            cache_ttl=self.cache_ttl,
         )
 
     def ensure_credential(self, env_var: str) -> str:
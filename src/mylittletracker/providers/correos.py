@@ -4,15 +4,24 @@ Correos provides a public API for tracking shipments without authentication.
 The API supports multiple languages and returns detailed tracking events.
 """
 
-import httpx
+from __future__ import annotations
+
+import re
 from datetime import datetime
-from typing import Dict, Any, Optional
-from urllib.parse import quote
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Optional
+from urllib.parse import quote, quote_plus
 
 from ..models import TrackingResponse, Shipment, TrackingEvent, ShipmentStatus
-from ..utils import get_with_retries, async_get_with_retries
 from .base import ProviderBase
 
+if TYPE_CHECKING:
+    import httpx
+
+# httpx (via ..utils) is imported inside the tracking functions, so URL-only
+# use of this module (build_tracking_url) stays cheap.
+
 # Correos Public API endpoint (no authentication required)
 BASE_URL = "https://api1.correos.es/digital-services/searchengines/api/v1/envios"
 
@@ -23,6 +32,44 @@ BASE_URL = "https://api1.correos.es/digital-services/searchengines/api/v1/envios
 # Other language codes (DE, IT, etc.) return HTTP 500 errors
 SUPPORTED_LANGUAGES = ["EN", "ES", "FR"]
 
+# Provider/carrier key shared by every model this module builds
+PROVIDER = "correos"
+
+# Seconds a successful lookup is served from the on-disk response cache
+CACHE_TTL = 300.0
+
+# Status keywords in priority order (earlier wins when several appear)
+_STATUS_KEYWORDS: dict[str, ShipmentStatus] = {
+    "entregado": ShipmentStatus.DELIVERED,
+    "delivered": ShipmentStatus.DELIVERED,
+    "reparto": ShipmentStatus.OUT_FOR_DELIVERY,
+    "delivery": ShipmentStatus.OUT_FOR_DELIVERY,
+    "transito": ShipmentStatus.IN_TRANSIT,
+    "transit": ShipmentStatus.IN_TRANSIT,
+    "admitido": ShipmentStatus.INFORMATION_RECEIVED,
+    "received": ShipmentStatus.INFORMATION_RECEIVED,
+}
+_STATUS_PRIORITY = {k: i for i, k in enumerate(_STATUS_KEYWORDS)}
+_STATUS_RE = re.compile("|".join(_STATUS_KEYWORDS))
+
+
+# Headers to ensure JSON response (not strictly required but recommended)
+# Without Accept: application/json, invalid tracking returns HTML errors
+_HEADERS = {
+    "User-Agent": "mylittletracker/0.1 (+https://example.com)",  # Optional
+    "Accept": "application/json",  # Recommended to avoid HTML error pages
+}
+
+
+def _request_url(shipment_code: str, language: str) -> str:
+    """API URL with the query string encoded up front (no per-request params).
+
+    - text: the tracking number (required)
+    - language: optional, defaults to ES if omitted
+    """
+    text, lang = quote_plus(shipment_code), quote_plus(language)
+    return f"{BASE_URL}?text={text}&language={lang}"
+
 
 def track(shipment_code: str, language: str = "EN") -> TrackingResponse:
     """Fetch tracking info for a Correos shipment.
@@ -68,21 +115,15 @@ def track(shipment_code: str, language: str = "EN") -> TrackingResponse:
     Returns:
         TrackingResponse with normalized tracking data
     """
-    # Build request parameters
-    params = {
-        "text": shipment_code,  # Required: tracking number
-        "language": language,  # Optional: defaults to ES if omitted
-    }
-
-    # Headers to ensure JSON response (not strictly required but recommended)
-    # Without Accept: application/json, invalid tracking returns HTML errors
-    headers = {
-        "User-Agent": "mylittletracker/0.1 (+https://example.com)",  # Optional
-        "Accept": "application/json",  # Recommended to avoid HTML error pages
-    }
-
-    response = get_with_retries(BASE_URL, params=params, headers=headers, timeout=20.0)
-    raw_data = response.json()
+    from ..utils import get_with_retries, json_loads
+
+    response = get_with_retries(
+        _request_url(shipment_code, language),
+        headers=_HEADERS,
+        timeout=20.0,
+        cache_ttl=CACHE_TTL,
+    )
+    raw_data = json_loads(response.content)
 
     return normalize_correos_response(raw_data, shipment_code)
 
@@ -97,29 +138,49 @@ async def track_async(
 
     See track() for detailed API requirements and behavior.
     """
-    # Build request parameters (same as sync version)
-    params = {
-        "text": shipment_code,  # Required: tracking number
-        "language": language,  # Optional: defaults to ES if omitted
-    }
-
-    # Headers to ensure JSON response
-    headers = {
-        "User-Agent": "mylittletracker/0.1 (+https://example.com)",  # Optional
-        "Accept": "application/json",  # Recommended to avoid HTML error pages
-    }
-    if client is None:
-        resp = await async_get_with_retries(
-            BASE_URL, params=params, headers=headers, timeout=20.0
-        )
-    else:
-        resp = await async_get_with_retries(
-            BASE_URL, params=params, headers=headers, timeout=20.0, client=client
-        )
-    raw_data = resp.json()
+    from ..utils import async_get_with_retries, json_loads
+
+    resp = await async_get_with_retries(
+        _request_url(shipment_code, language),
+        headers=_HEADERS,
+        timeout=20.0,
+        client=client,
+        cache_ttl=CACHE_TTL,
+    )
+    raw_data = json_loads(resp.content)
     return normalize_correos_response(raw_data, shipment_code)
 
 
+async def track_many_async(
+    codes: Iterable[str],
+    language: str = "EN",
+    *,
+    client: Optional[httpx.AsyncClient] = None,
+    concurrency: int = 8,
+) -> list[TrackingResponse]:
+    """Track several shipments concurrently over one connection pool.
+
+    At most `concurrency` requests are in flight at once. Results are returned
+    in the order of `codes`; the first failure propagates.
+    """
+    from ..utils import gather_bounded
+
+    return await gather_bounded(
+        lambda code: track_async(code, language, client=client), codes, concurrency
+    )
+
+
+def track_many(codes: Iterable[str], language: str = "EN") -> list[TrackingResponse]:
+    """Synchronous wrapper around track_many_async().
+
+    Raises RuntimeError inside a running event loop; await track_many_async()
+    there instead.
+    """
+    from ..utils import run_async
+
+    return run_async(track_many_async(codes, language))
+
+
 def normalize_correos_response(
     raw_data: Dict[str, Any], tracking_number: str
 ) -> TrackingResponse:
@@ -148,6 +209,10 @@ def normalize_correos_response(
     - summaryText: Brief status description (language-dependent)
     - extendedText: Detailed status description
     - codired: Location/office code (when available)
+
+    Models are built with model_construct (no validation): every field below
+    is set from values already coerced to the model's types, so keep it that
+    way when adding fields.
     """
     shipments: list[Shipment] = []
 
@@ -155,39 +220,22 @@ def normalize_correos_response(
     shipment_list = raw_data.get("shipment", [])
     if not shipment_list:
         # No shipments found
-        return TrackingResponse(shipments=shipments, provider="correos")
+        return TrackingResponse.model_construct(shipments=shipments, provider=PROVIDER)
 
     correos_shipment = shipment_list[0]  # Take first shipment
-    events = []
-
-    # Convert events
-    for event in correos_shipment.get("events", []):
-        # Parse date and time
-        event_date = event.get("eventDate", "")
-        event_time = event.get("eventTime", "")
-
-        # Combine date and time into datetime
-        timestamp = _parse_correos_datetime(event_date, event_time)
-
-        tracking_event = TrackingEvent(
-            timestamp=timestamp,
-            status=event.get("summaryText", ""),
-            details=event.get("extendedText"),
-            location=None,  # Correos doesn't seem to provide location separately
-            status_code=str(event.get("eventCode", "")) or None,
-            extras=None,
-        )
-        events.append(tracking_event)
 
-    # Sort events chronologically for consistency
-    events.sort(key=lambda e: e.timestamp)
+    # Convert events, sorted chronologically for consistency
+    events = sorted(
+        map(_make_correos_event, correos_shipment.get("events") or ()),
+        key=attrgetter("timestamp"),
+    )
 
     # Determine overall shipment status from latest event
     status = _infer_correos_status(events)
 
-    shipment = Shipment(
-        tracking_number=correos_shipment.get("shipmentCode", tracking_number),
-        carrier="correos",
+    shipment = Shipment.model_construct(
+        tracking_number=correos_shipment.get("shipmentCode") or tracking_number,
+        carrier=PROVIDER,
         status=status,
         events=events,
         service_type=None,
@@ -200,30 +248,55 @@ def normalize_correos_response(
 
     shipments.append(shipment)
 
-    return TrackingResponse(shipments=shipments, provider="correos")
+    return TrackingResponse.model_construct(shipments=shipments, provider=PROVIDER)
+
+
+def _make_correos_event(event: Dict[str, Any]) -> TrackingEvent:
+    """Build one TrackingEvent from a Correos event object."""
+    # Combine date and time into datetime
+    timestamp = _parse_correos_datetime(
+        event.get("eventDate") or "", event.get("eventTime") or ""
+    )
+    return TrackingEvent.model_construct(
+        timestamp=timestamp,
+        status=event.get("summaryText") or "",
+        details=event.get("extendedText") or None,
+        location=None,  # Correos doesn't seem to provide location separately
+        status_code=str(event.get("eventCode", "")) or None,
+        extras=None,
+    )
 
 
 def _parse_correos_datetime(date_str: str, time_str: str) -> datetime:
     """Parse Correos date and time strings into datetime object.
 
     Correos date format: DD/MM/YYYY (e.g., "08/09/2025")
-    Correos time format: HH:MM:SS (e.g., "11:48:03")
+    Correos time format: HH:MM:SS (e.g., "11:48:03"); HH:MM is also accepted
 
     Note: Correos timestamps don't include timezone information,
     so we assume local Spanish time (would need pytz for proper handling).
     """
+    # Fallback if parsing fails (not cached: it must be the current time)
+    return _parse_correos_fields(date_str, time_str) or datetime.now()
+
+
+@lru_cache(maxsize=1024)
+def _parse_correos_fields(date_str: str, time_str: str) -> Optional[datetime]:
+    # Fixed-width slicing instead of strptime; events often repeat timestamps
+    # across refreshes, hence the cache.
+    if len(date_str) != 10 or date_str[2] != "/" or date_str[5] != "/":
+        return None
     try:
-        # Assume format like "DD/MM/YYYY" and "HH:MM"
-        if date_str and time_str:
-            datetime_str = f"{date_str} {time_str}"
-            return datetime.strptime(datetime_str, "%d/%m/%Y %H:%M")
-        elif date_str:
-            return datetime.strptime(date_str, "%d/%m/%Y")
-        else:
-            return datetime.now()
+        year, month, day = int(date_str[6:10]), int(date_str[3:5]), int(date_str[0:2])
+        if not time_str:
+            return datetime(year, month, day)
+        if len(time_str) not in (5, 8) or time_str[2] != ":":
+            return None
+        hour, minute = int(time_str[0:2]), int(time_str[3:5])
+        second = int(time_str[6:8]) if len(time_str) == 8 else 0
+        return datetime(year, month, day, hour, minute, second)
     except ValueError:
-        # Fallback if parsing fails
-        return datetime.now()
+        return None
 
 
 def _infer_correos_status(events: list[TrackingEvent]) -> ShipmentStatus:
@@ -244,16 +317,11 @@ def _infer_correos_status(events: list[TrackingEvent]) -> ShipmentStatus:
     # Check latest event for delivery-related keywords
     latest_status = events[-1].status.lower()
 
-    if "entregado" in latest_status or "delivered" in latest_status:
-        return ShipmentStatus.DELIVERED
-    elif "reparto" in latest_status or "delivery" in latest_status:
-        return ShipmentStatus.OUT_FOR_DELIVERY
-    elif "transito" in latest_status or "transit" in latest_status:
-        return ShipmentStatus.IN_TRANSIT
-    elif "admitido" in latest_status or "received" in latest_status:
-        return ShipmentStatus.INFORMATION_RECEIVED
-    else:
+    # One regex scan; pick the highest-priority keyword found
+    found = _STATUS_RE.findall(latest_status)
+    if not found:
         return ShipmentStatus.UNKNOWN  # Default fallback for unmapped statuses
+    return _STATUS_KEYWORDS[min(found, key=_STATUS_PRIORITY.__getitem__)]
 
 
 def build_tracking_url(shipment_code: str, *, language: str = "ES") -> Optional[str]:
@@ -272,7 +340,7 @@ class CorreosProvider(ProviderBase):
     public module-level APIs or documentation.
     """
 
-    provider = "correos"
+    provider = PROVIDER
 
     def build_tracking_url(
         self, tracking_number: str, *, language: Optional[str] = None, **kwargs: Any
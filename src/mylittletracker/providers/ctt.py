@@ -1,14 +1,40 @@
+import re
 import httpx
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
-import unicodedata
 
-from ..models import TrackingResponse, Shipment, TrackingEvent, ShipmentStatus
-from ..utils import parse_dt_iso, get_with_retries, async_get_with_retries
+from ..models import (
+    TrackingResponse,
+    Shipment,
+    TrackingEvent,
+    ShipmentStatus,
+)
+from ..utils import (
+    parse_dt_iso,
+    get_with_retries,
+    async_get_with_retries,
+    flag_stale,
+    json_loads,
+    opt_str,
+)
 from .base import ProviderBase
 
 BASE_URL = "https://wct.cttexpress.com/p_track_redis.php"
 
+# Seconds a successful lookup is served from the on-disk response cache
+CACHE_TTL = 60.0
+# While the API fails, fall back to a cached response up to this old
+STALE_TTL = 24 * 3600.0
+
+_HEADERS = {
+    "User-Agent": "mylittletracker/0.1 (+https://example.com)",
+    "Accept": "application/json",
+}
+
+# Event detail fields holding readable text, in order of preference
+_DETAIL_KEYS = ("item_event_text", "External_event_text", "event_courier_code")
+
 
 def track(sc: str, *, language: Optional[str] = None) -> TrackingResponse:
     """Fetch tracking info for a CTT Express shipment by shipping code (sc).
@@ -16,16 +42,19 @@ def track(sc: str, *, language: Optional[str] = None) -> TrackingResponse:
     CTT public JSON endpoint example:
     https://wct.cttexpress.com/p_track_redis.php?sc=0082800082909720118884
     """
-    headers = {
-        "User-Agent": "mylittletracker/0.1 (+https://example.com)",
-        "Accept": "application/json",
-    }
     params = {"sc": sc}
 
-    resp = get_with_retries(BASE_URL, params=params, headers=headers, timeout=20.0)
-    raw = resp.json()
+    resp = get_with_retries(
+        BASE_URL,
+        params=params,
+        headers=_HEADERS,
+        timeout=20.0,
+        cache_ttl=CACHE_TTL,
+        stale_ttl=STALE_TTL,
+    )
+    raw = json_loads(resp.content)
 
-    return normalize_ctt_response(raw, sc)
+    return flag_stale(normalize_ctt_response(raw, sc), resp)
 
 
 async def track_async(
@@ -35,29 +64,36 @@ async def track_async(
     client: Optional[httpx.AsyncClient] = None,
 ) -> TrackingResponse:
     """Async version of CTT tracking."""
-    headers = {
-        "User-Agent": "mylittletracker/0.1 (+https://example.com)",
-        "Accept": "application/json",
-    }
     params = {"sc": sc}
 
     resp = await async_get_with_retries(
-        BASE_URL, params=params, headers=headers, timeout=20.0, client=client
+        BASE_URL,
+        params=params,
+        headers=_HEADERS,
+        timeout=20.0,
+        client=client,
+        cache_ttl=CACHE_TTL,
+        stale_ttl=STALE_TTL,
     )
-    raw = resp.json()
+    raw = json_loads(resp.content)
 
-    return normalize_ctt_response(raw, sc)
+    return flag_stale(normalize_ctt_response(raw, sc), resp)
 
 
 def normalize_ctt_response(
     raw: Dict[str, Any], tracking_number: str
 ) -> TrackingResponse:
-    """Normalize CTT Express JSON payload to TrackingResponse."""
+    """Normalize CTT Express JSON payload to TrackingResponse.
+
+    Models are built with model_construct (no validation), so payload values
+    are coerced to the model's types first (opt_str() for text fields); keep
+    it that way when adding fields.
+    """
     data = (raw or {}).get("data") or {}
     shipments: List[Shipment] = []
 
     if not data:
-        return TrackingResponse(shipments=shipments, provider="ctt")
+        return TrackingResponse.model_construct(shipments=shipments, provider="ctt")
 
     shipping_history = data.get("shipping_history") or {}
     raw_events = shipping_history.get("events") or []
@@ -70,20 +106,20 @@ def normalize_ctt_response(
         )
         ts = parse_dt_iso(dt_str) or datetime.now()
 
-        desc = ev.get("description") or ev.get("type") or ""
-        status_code = ev.get("code")
+        desc = str(ev.get("description") or ev.get("type") or "")
+        status_code = opt_str(ev.get("code"))
 
         # Details: include courier code/text if present and meaningful
         det = ev.get("detail") or {}
         details = None
-        for k in ("item_event_text", "External_event_text", "event_courier_code"):
+        for k in _DETAIL_KEYS:
             v = det.get(k)
             if isinstance(v, str) and v.lower() != "null" and v.strip():
                 details = v
                 break
 
         events.append(
-            TrackingEvent(
+            TrackingEvent.model_construct(
                 timestamp=ts,
                 status=desc,
                 location=None,
@@ -95,16 +131,15 @@ def normalize_ctt_response(
                 },
             )
         )
-
     # Ensure chronological order
-    events.sort(key=lambda e: e.timestamp)
+    events.sort(key=attrgetter("timestamp"))
 
     # Determine overall shipment status
     status = _infer_ctt_status(events)
 
     # Compose origin/destination (use provided names if available)
-    origin = data.get("origin_name") or data.get("origin_province_name")
-    destination = data.get("destin_name") or data.get("destin_province_name")
+    origin = opt_str(data.get("origin_name") or data.get("origin_province_name"))
+    destination = opt_str(data.get("destin_name") or data.get("destin_province_name"))
 
     # Estimated vs actual delivery
     est_str = (
@@ -118,7 +153,7 @@ def normalize_ctt_response(
         ad_str = data.get("delivery_date") or est_str
         actual_delivery = parse_dt_iso(ad_str) if ad_str else None
 
-    tracking = data.get("shipping_code") or tracking_number
+    tracking = str(data.get("shipping_code") or tracking_number)
 
     # Populate extras for CTT-specific data
     extras = {
@@ -133,7 +168,7 @@ def normalize_ctt_response(
         "has_custom": data.get("has_custom"),
     }
 
-    shipment = Shipment(
+    shipment = Shipment.model_construct(
         tracking_number=tracking,
         carrier="ctt",
         status=status,
@@ -147,40 +182,59 @@ def normalize_ctt_response(
     )
     shipments.append(shipment)
 
-    return TrackingResponse(shipments=shipments, provider="ctt")
+    return TrackingResponse.model_construct(shipments=shipments, provider="ctt")
 
 
 def _parse_dt(s: Optional[str]) -> Optional[datetime]:
     # Deprecated in favor of utils.parse_dt_iso
     return parse_dt_iso(s)
-    if not s:
-        return None
-    try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
-    except Exception:
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(s, fmt)
-            except Exception:
-                continue
-    return None
 
 
 def _parse_date(s: Optional[str]) -> Optional[datetime]:
     # Deprecated in favor of utils.parse_dt_iso
     return parse_dt_iso(s)
-    if not s:
-        return None
-    # Date-only becomes midnight
-    try:
-        if "T" in s:
-            return _parse_dt(s)
-        return datetime.strptime(s, "%Y-%m-%d")
-    except Exception:
-        try:
-            return datetime.fromisoformat(s.replace("Z", "+00:00"))
-        except Exception:
-            return None
+
+
+_CODE_MAP = {
+    # Observed codes from sample: 0000, 1000, 1500; plus 2310 observed as available for pickup
+    "0000": ShipmentStatus.INFORMATION_RECEIVED,
+    "1000": ShipmentStatus.IN_TRANSIT,
+    "1500": ShipmentStatus.OUT_FOR_DELIVERY,
+    "2310": ShipmentStatus.AVAILABLE_FOR_PICKUP,
+    # Future observations (documented placeholders):
+    # "2000": ShipmentStatus.DELIVERED,
+    # "2400": ShipmentStatus.EXCEPTION,
+}
+
+# Accented (lowercase) letters -> ASCII, applied after str.lower()
+_ACCENT_TABLE = str.maketrans("àáâäãèéêëìíîïòóôöõùúûüñç", "aaaaaeeeeiiiiooooouuuunc")
+
+# Phrases per status, checked in order (first match wins); already normalized
+_PHRASE_STATUSES: tuple[tuple[tuple[str, ...], ShipmentStatus], ...] = (
+    (("entregado", "entrega realizada"), ShipmentStatus.DELIVERED),
+    (
+        ("entrega hoy", "en reparto", "reparto", "delivery today"),
+        ShipmentStatus.OUT_FOR_DELIVERY,
+    ),
+    (
+        ("disponible para recoger", "para recoger", "punto de recogida"),
+        ShipmentStatus.AVAILABLE_FOR_PICKUP,
+    ),
+    (("transito", "en transito", "in transit"), ShipmentStatus.IN_TRANSIT),
+    (
+        ("pendiente de recepcion", "pendiente de recogida", "admitido"),
+        ShipmentStatus.INFORMATION_RECEIVED,
+    ),
+)
+# All phrases in one alternation (single scan); phrase -> (priority, status)
+_PHRASE_INDEX = {
+    p: (rank, status)
+    for rank, (phrases, status) in enumerate(_PHRASE_STATUSES)
+    for p in phrases
+}
+# Zero-width lookahead, as utils._TEXT_STATUS_RE: overlapping phrases
+# ("para recogereparto") are all seen
+_PHRASE_RE = re.compile("(?=(%s))" % "|".join(map(re.escape, _PHRASE_INDEX)))
 
 
 def _infer_ctt_status(events: List[TrackingEvent]) -> ShipmentStatus:
@@ -192,49 +246,16 @@ def _infer_ctt_status(events: List[TrackingEvent]) -> ShipmentStatus:
 
     # First try explicit mapping by code if present in latest event
     code = (latest.status_code or "").strip()
-    code_map = {
-        # Observed codes from sample: 0000, 1000, 1500; plus 2310 observed as available for pickup
-        "0000": ShipmentStatus.INFORMATION_RECEIVED,
-        "1000": ShipmentStatus.IN_TRANSIT,
-        "1500": ShipmentStatus.OUT_FOR_DELIVERY,
-        "2310": ShipmentStatus.AVAILABLE_FOR_PICKUP,
-        # Future observations (documented placeholders):
-        # "2000": ShipmentStatus.DELIVERED,
-        # "2400": ShipmentStatus.EXCEPTION,
-    }
-    if code in code_map:
-        return code_map[code]
-
-    def _norm(t: str) -> str:
-        # Remove accents and lowercase for robust matching
-        return "".join(
-            c
-            for c in unicodedata.normalize("NFD", t.lower())
-            if unicodedata.category(c) != "Mn"
-        )
+    if code in _CODE_MAP:
+        return _CODE_MAP[code]
 
-    t = _norm(text)
+    # Remove accents and lowercase for robust matching
+    t = text.lower().translate(_ACCENT_TABLE)
 
     # Common Spanish phrases seen in CTT payloads
-    if "entregado" in t or "entrega realizada" in t:
-        return ShipmentStatus.DELIVERED
-    if (
-        "entrega hoy" in t
-        or "en reparto" in t
-        or "reparto" in t
-        or "delivery today" in t
-    ):
-        return ShipmentStatus.OUT_FOR_DELIVERY
-    if (
-        "disponible para recoger" in t
-        or "para recoger" in t
-        or "punto de recogida" in t
-    ):
-        return ShipmentStatus.AVAILABLE_FOR_PICKUP
-    if "transito" in t or "en transito" in t or "in transit" in t:
-        return ShipmentStatus.IN_TRANSIT
-    if "pendiente de recepcion" in t or "pendiente de recogida" in t or "admitido" in t:
-        return ShipmentStatus.INFORMATION_RECEIVED
+    found = _PHRASE_RE.findall(t)
+    if found:
+        return min(map(_PHRASE_INDEX.__getitem__, found))[1]
 
     # Fallback to generic mapper
     from ..utils import map_status_from_text
@@ -7,19 +7,37 @@ API Documentation: https://developer.dhl.com/api-reference/shipment-tracking
 OpenAPI Spec Version: 1.5.6
 """
 
+import asyncio
 import os
+import re
 import httpx
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional
 from urllib.parse import quote
 
-from ..models import TrackingResponse, Shipment, TrackingEvent, ShipmentStatus
+from ..models import (
+    TrackingResponse,
+    Shipment,
+    TrackingEvent,
+    ShipmentStatus,
+)
 from ..utils import (
     parse_dt_iso,
     get_with_retries,
     async_get_with_retries,
+    flag_stale,
+    json_loads,
     map_status_from_text,
+    STALE_EXTENSION,
+    ensure_no_running_loop,
+    gather_bounded,
+    run_async,
+    opt_str,
 )
+from ..cache import MemoryCache
 from .base import ProviderBase
 
 # DHL Unified Tracking API endpoints
@@ -28,6 +46,19 @@ TEST_BASE = "https://api-test.dhl.com/track/shipments"
 # Production server for live tracking (requires production API key)
 PROD_BASE = "https://api-eu.dhl.com/track/shipments"
 
+# Seconds a successful lookup is served from the on-disk response cache
+CACHE_TTL = 60.0
+# While the API fails, fall back to a cached response up to this old
+STALE_TTL = 24 * 3600.0
+
+# Tracking numbers sent per multi-number UTAPI request (see track_many())
+BATCH_MAX = 10
+
+# Parsed results of recent lookups; callers get deep copies
+_RESULTS = MemoryCache(maxsize=1024, ttl=CACHE_TTL)
+# Requests in flight per (event loop, result key), see track_async()
+_inflight: Dict[Hashable, "asyncio.Future[TrackingResponse]"] = {}
+
 # Supported DHL services/divisions (from OpenAPI spec)
 # Each service represents a different DHL business unit:
 # - express: DHL Express (time-definite international)
@@ -56,6 +87,31 @@ DHL_SERVICES = [
     "svb",
 ]
 
+# UTAPI statusCode -> unified status (see _map_utapi_status_code)
+_UTAPI_STATUS_MAP = {
+    "delivered": ShipmentStatus.DELIVERED,
+    "failure": ShipmentStatus.EXCEPTION,
+    "pre-transit": ShipmentStatus.INFORMATION_RECEIVED,
+    "transit": ShipmentStatus.IN_TRANSIT,
+}
+
+# Required headers for UTAPI, minus the per-call DHL-API-Key
+_HEADERS = MappingProxyType(
+    {
+        "User-Agent": "mylittletracker/0.1 (+https://example.com)",  # Identify client
+        "Accept": "application/json",  # Request JSON response
+    }
+)
+
+# Shared read-only default for missing nested objects
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Event wording that means out-for-delivery even when UTAPI reports 'transit'
+# ("delivery vehicle" also covers "loaded onto the delivery vehicle")
+_OUT_FOR_DELIVERY_RE = re.compile(
+    r"out for delivery|in delivery|delivery vehicle", re.IGNORECASE
+)
+
 
 def _base_url(server: str) -> str:
     return TEST_BASE if server.lower() == "test" else PROD_BASE
@@ -73,16 +129,7 @@ def _map_utapi_status_code(code: Optional[str]) -> ShipmentStatus:
     """
     if not code:
         return ShipmentStatus.UNKNOWN
-    c = code.lower()
-    if c == "delivered":
-        return ShipmentStatus.DELIVERED
-    if c == "failure":
-        return ShipmentStatus.EXCEPTION
-    if c == "pre-transit":
-        return ShipmentStatus.INFORMATION_RECEIVED
-    if c == "transit":
-        return ShipmentStatus.IN_TRANSIT
-    return ShipmentStatus.UNKNOWN
+    return _UTAPI_STATUS_MAP.get(code.lower(), ShipmentStatus.UNKNOWN)
 
 
 def build_tracking_url(tracking_number: str, *, language: str = "en") -> Optional[str]:
@@ -123,6 +170,7 @@ class DHLProvider(ProviderBase):
         )
 
 
+@lru_cache(maxsize=256)
 def _looks_like_short_code(s: Optional[str]) -> bool:
     """Check if status text looks like a short code.
 
@@ -148,10 +196,23 @@ def _select_event_text(e: Dict[str, Any]) -> tuple[str, Optional[str]]:
     1. Use description as status if status is a short code
     2. Combine remaining fields into details
     """
-    status_text = (e.get("status") or "").strip()
-    desc = (e.get("description") or e.get("statusDetailed") or "").strip()
-    next_steps = (e.get("nextSteps") or "").strip()
-    remark = (e.get("remark") or "").strip()
+    return _select_event_text_cached(
+        str(e.get("status") or ""),
+        str(e.get("description") or e.get("statusDetailed") or ""),
+        str(e.get("nextSteps") or ""),
+        str(e.get("remark") or ""),
+    )
+
+
+# Events of one shipment often repeat the same texts (same scan point revisited)
+@lru_cache(maxsize=512)
+def _select_event_text_cached(
+    status: str, desc: str, next_steps: str, remark: str
+) -> tuple[str, Optional[str]]:
+    status_text = status.strip()
+    desc = desc.strip()
+    next_steps = next_steps.strip()
+    remark = remark.strip()
 
     if _looks_like_short_code(status_text) and desc:
         status_out = desc
@@ -171,6 +232,61 @@ def _select_event_text(e: Dict[str, Any]) -> tuple[str, Optional[str]]:
     return status_out, details_out
 
 
+def _prepare_request(
+    tracking_number: str,
+    *,
+    language: str,
+    service: Optional[str],
+    requester_country_code: Optional[str],
+    origin_country_code: Optional[str],
+    recipient_postal_code: Optional[str],
+    offset: Optional[int],
+    limit: Optional[int],
+    server: Optional[str],
+) -> tuple[str, Dict[str, Any], Mapping[str, str]]:
+    """Return (url, params, headers) for a UTAPI tracking request."""
+    # API key is required for authentication
+    # Get from environment variable (can be set in .env file)
+    api_key = os.getenv("DHL_API_KEY")
+    if not api_key:
+        raise RuntimeError(
+            "DHL_API_KEY is not set. Add it to your environment or .env file."
+        )
+
+    # Select server: test or production
+    # Can be overridden via DHL_SERVER env var or server parameter
+    server = server or os.getenv("DHL_SERVER", "prod") or "prod"
+
+    # Optional parameters to refine search; unset (empty) ones are left out
+    optional = (
+        ("service", service),  # Hint which DHL division
+        ("requesterCountryCode", requester_country_code),  # Optimize response
+        ("originCountryCode", origin_country_code),  # Qualify tracking number
+        ("recipientPostalCode", recipient_postal_code),  # Required for some services
+    )
+
+    # Build query parameters according to UTAPI spec
+    params: Dict[str, Any] = {
+        "trackingNumber": tracking_number,  # Required
+        "language": language,  # Default: en
+        **{k: v for k, v in optional if v},
+    }
+    if offset is not None:
+        params["offset"] = offset  # Pagination
+
+    # UTAPI default limit is 5; request more history unless caller overrides
+    # This ensures we get complete tracking history
+    params["limit"] = 50 if limit is None else limit
+
+    return _base_url(server), params, _auth_headers(api_key)
+
+
+# The key rarely changes, so every request can share one read-only header map
+@lru_cache(maxsize=4)
+def _auth_headers(api_key: str) -> Mapping[str, str]:
+    return MappingProxyType({**_HEADERS, "DHL-API-Key": api_key})
+
+
 def track(
     tracking_number: str,
     *,
@@ -182,6 +298,7 @@ def track(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     server: Optional[str] = None,
+    fresh: bool = False,
 ) -> TrackingResponse:
     """Fetch tracking info for a DHL shipment using Unified Tracking API.
 
@@ -239,6 +356,8 @@ def track(
         offset: Pagination offset
         limit: Max events to retrieve
         server: 'test' or 'prod' (default: prod)
+        fresh: Skip cached results; an expired on-disk entry may still be
+            revalidated with a conditional GET
 
     Returns:
         TrackingResponse with normalized tracking data
@@ -246,55 +365,32 @@ def track(
     Raises:
         RuntimeError: If DHL_API_KEY environment variable not set
     """
-    # API key is required for authentication
-    # Get from environment variable (can be set in .env file)
-    api_key = os.getenv("DHL_API_KEY")
-    if not api_key:
-        raise RuntimeError(
-            "DHL_API_KEY is not set. Add it to your environment or .env file."
-        )
-
-    # Select server: test or production
-    # Can be overridden via DHL_SERVER env var or server parameter
-    server = server or os.getenv("DHL_SERVER", "prod") or "prod"
-
-    # Build query parameters according to UTAPI spec
-    params: Dict[str, Any] = {
-        "trackingNumber": tracking_number,  # Required
-        "language": language,  # Default: en
-    }
-
-    # Optional parameters to refine search
-    if service:
-        params["service"] = service  # Hint which DHL division
-    if requester_country_code:
-        params["requesterCountryCode"] = requester_country_code  # Optimize response
-    if origin_country_code:
-        params["originCountryCode"] = origin_country_code  # Qualify tracking number
-    if recipient_postal_code:
-        params["recipientPostalCode"] = (
-            recipient_postal_code  # Required for some services
-        )
-    if offset is not None:
-        params["offset"] = offset  # Pagination
+    url, params, headers = _prepare_request(
+        tracking_number,
+        language=language,
+        service=service,
+        requester_country_code=requester_country_code,
+        origin_country_code=origin_country_code,
+        recipient_postal_code=recipient_postal_code,
+        offset=offset,
+        limit=limit,
+        server=server,
+    )
 
-    # UTAPI default limit is 5; request more history unless caller overrides
-    # This ensures we get complete tracking history
-    params["limit"] = 50 if limit is None else limit
-
-    # Required headers for UTAPI
-    headers = {
-        "User-Agent": "mylittletracker/0.1 (+https://example.com)",  # Identify client
-        "Accept": "application/json",  # Request JSON response
-        "DHL-API-Key": api_key,  # Required authentication
-    }
+    key = _result_key(url, params, headers)
+    cached = None if fresh else _RESULTS.get(key)
+    if cached is not None:
+        return cached.model_copy(deep=True)
 
     response = get_with_retries(
-        _base_url(server), params=params, headers=headers, timeout=20.0
+        url,
+        params=params,
+        headers=headers,
+        timeout=20.0,
+        cache_ttl=None if fresh else CACHE_TTL,
+        stale_ttl=STALE_TTL,
     )
-    raw_data = response.json()
-
-    return normalize_dhl_response(raw_data, tracking_number)
+    return _finish(key, response, tracking_number).model_copy(deep=True)
 
 
 async def track_async(
@@ -309,60 +405,228 @@ async def track_async(
     limit: Optional[int] = None,
     server: Optional[str] = None,
     client: Optional[httpx.AsyncClient] = None,
+    fresh: bool = False,
 ) -> TrackingResponse:
     """Async version of DHL tracking.
 
     See track() for detailed API documentation and parameter descriptions.
     """
-    # API key is required for authentication
-    # Get from environment variable (can be set in .env file)
-    api_key = os.getenv("DHL_API_KEY")
-    if not api_key:
-        raise RuntimeError(
-            "DHL_API_KEY is not set. Add it to your environment or .env file."
-        )
+    url, params, headers = _prepare_request(
+        tracking_number,
+        language=language,
+        service=service,
+        requester_country_code=requester_country_code,
+        origin_country_code=origin_country_code,
+        recipient_postal_code=recipient_postal_code,
+        offset=offset,
+        limit=limit,
+        server=server,
+    )
 
-    # Select server: test or production
-    # Can be overridden via DHL_SERVER env var or server parameter
-    server = server or os.getenv("DHL_SERVER", "prod") or "prod"
+    key = _result_key(url, params, headers)
+    # A caller-supplied client always sees the request, as in utils
+    cached = None if fresh or client is not None else _RESULTS.get(key)
+    if cached is not None:
+        return cached.model_copy(deep=True)
+
+    # Single flight: concurrent lookups of the same shipment share one request,
+    # but only among callers using the same client (None: the shared pool)
+    flight_key = (asyncio.get_running_loop(), key, fresh, client)
+    task = _inflight.get(flight_key)
+    if task is None:
+
+        async def fetch() -> TrackingResponse:
+            try:
+                response = await async_get_with_retries(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=20.0,
+                    client=client,
+                    cache_ttl=None if fresh else CACHE_TTL,
+                    stale_ttl=STALE_TTL,
+                )
+                return _finish(key, response, tracking_number, keep=client is None)
+            finally:
+                _inflight.pop(flight_key, None)
+
+        task = _inflight[flight_key] = asyncio.ensure_future(fetch())
+    # shield: a cancelled waiter must not cancel the request others wait on
+    result = await asyncio.shield(task)
+    return result.model_copy(deep=True)
+
+
+def _result_key(
+    url: str, params: Dict[str, Any], headers: Mapping[str, str]
+) -> Hashable:
+    # The URL carries the server; the API key keeps callers with different
+    # credentials from seeing each other's results
+    return (url, tuple(sorted(params.items())), headers["DHL-API-Key"])
+
+
+def _finish(
+    key: Hashable,
+    response: httpx.Response,
+    tracking_number: str,
+    *,
+    keep: bool = True,
+) -> TrackingResponse:
+    """Normalize a UTAPI response and keep it in the in-process result cache.
 
-    # Build query parameters according to UTAPI spec
-    params: Dict[str, Any] = {
-        "trackingNumber": tracking_number,  # Required
-        "language": language,  # Default: en
-    }
+    Results served by the stale fallback, or fetched with keep=False, are not
+    kept, so the next call retries the API.
+    """
+    raw_data = json_loads(response.content)
+    result = flag_stale(normalize_dhl_response(raw_data, tracking_number), response)
+    if keep and not response.extensions.get(STALE_EXTENSION):
+        _RESULTS.set(key, result)
+    return result
 
-    # Optional parameters to refine search
-    if service:
-        params["service"] = service  # Hint which DHL division
-    if requester_country_code:
-        params["requesterCountryCode"] = requester_country_code  # Optimize response
-    if origin_country_code:
-        params["originCountryCode"] = origin_country_code  # Qualify tracking number
-    if recipient_postal_code:
-        params["recipientPostalCode"] = (
-            recipient_postal_code  # Required for some services
-        )
-    if offset is not None:
-        params["offset"] = offset  # Pagination
 
-    # UTAPI default limit is 5; request more history unless caller overrides
-    # This ensures we get complete tracking history
-    params["limit"] = 50 if limit is None else limit
+async def track_many_async(
+    tracking_numbers: Iterable[str],
+    *,
+    language: str = "en",
+    client: Optional[httpx.AsyncClient] = None,
+    concurrency: int = 8,
+    **kwargs: Any,
+) -> list[TrackingResponse]:
+    """Track several shipments concurrently over one connection pool.
+
+    At most `concurrency` requests are in flight at once. Results are returned
+    in the order of `tracking_numbers`; the first failure propagates. Keyword
+    arguments are passed through to track_async().
+    """
+    return await gather_bounded(
+        lambda n: track_async(n, language=language, client=client, **kwargs),
+        tracking_numbers,
+        concurrency,
+    )
 
-    # Required headers for UTAPI
-    headers = {
-        "User-Agent": "mylittletracker/0.1 (+https://example.com)",  # Identify client
-        "Accept": "application/json",  # Request JSON response
-        "DHL-API-Key": api_key,  # Required authentication
-    }
 
-    response = await async_get_with_retries(
-        _base_url(server), params=params, headers=headers, timeout=20.0, client=client
+def track_many(
+    tracking_numbers: Iterable[str], *, language: str = "en", **kwargs: Any
+) -> list[TrackingResponse]:
+    """Track several shipments with as few UTAPI requests as possible.
+
+    UTAPI accepts a comma-separated trackingNumber list, so numbers are sent
+    BATCH_MAX per request. Results are returned in the order of
+    `tracking_numbers`, one TrackingResponse each. Numbers missing from the
+    batch answers, or a whole batch rejected with a 4xx, are then tracked
+    individually and concurrently via track_many_async(); errors from those
+    calls propagate.
+
+    Keyword arguments are those of track(), including fresh; results share
+    track()'s in-process cache. Repeated numbers get independent copies of
+    the same result. Raises RuntimeError inside a running event loop; use
+    track_many_async() there.
+    """
+    ensure_no_running_loop("track_many_async")
+    unexpected = kwargs.keys() - _TRACK_OPTIONS
+    if unexpected:
+        raise TypeError(
+            f"track_many() got an unexpected keyword argument {min(unexpected)!r}"
+        )
+    fresh = bool(kwargs.get("fresh"))
+    numbers = list(tracking_numbers)
+    unique = list(dict.fromkeys(numbers))
+
+    by_id: Dict[str, TrackingResponse] = {}
+    if not fresh:
+        for n in unique:
+            cached = _RESULTS.get(_number_key(n, language, kwargs))
+            if cached is not None:
+                by_id[n] = cached.model_copy(deep=True)
+
+    pending = [n for n in unique if n not in by_id]
+    for start in range(0, len(pending), BATCH_MAX):
+        by_id.update(_track_batch(pending[start : start + BATCH_MAX], language, kwargs))
+
+    missing = [n for n in unique if n not in by_id]
+    if len(missing) == 1:
+        by_id[missing[0]] = track(missing[0], language=language, **kwargs)
+    elif missing:
+        results = run_async(track_many_async(missing, language=language, **kwargs))
+        by_id.update(zip(missing, results))
+
+    out: list[TrackingResponse] = []
+    seen: set[str] = set()
+    for n in numbers:
+        result = by_id[n]
+        out.append(result.model_copy(deep=True) if n in seen else result)
+        seen.add(n)
+    return out
+
+
+# track() keywords that shape the request, and all those track_many() accepts
+_REQUEST_OPTIONS = (
+    "service",
+    "requester_country_code",
+    "origin_country_code",
+    "recipient_postal_code",
+    "offset",
+    "limit",
+    "server",
+)
+_TRACK_OPTIONS = frozenset((*_REQUEST_OPTIONS, "fresh"))
+
+
+def _number_key(number: str, language: str, options: Dict[str, Any]) -> Hashable:
+    """The _RESULTS key track() uses for `number` with these options."""
+    return _result_key(
+        *_prepare_request(
+            number, language=language, **{k: options.get(k) for k in _REQUEST_OPTIONS}
+        )
     )
-    raw_data = response.json()
 
-    return normalize_dhl_response(raw_data, tracking_number)
+
+def _track_batch(
+    batch: list[str], language: str, options: Dict[str, Any]
+) -> Dict[str, TrackingResponse]:
+    """One multi-number UTAPI request; maps each returned shipment id to its result.
+
+    Each result is also kept in _RESULTS under the key track() would use,
+    unless served by the stale fallback. A 4xx for a multi-number batch
+    yields {} so the caller falls back to single-number lookups.
+    """
+    url, params, headers = _prepare_request(
+        ",".join(batch),
+        language=language,
+        **{k: options.get(k) for k in _REQUEST_OPTIONS},
+    )
+    try:
+        response = get_with_retries(
+            url,
+            params=params,
+            headers=headers,
+            timeout=20.0,
+            cache_ttl=None if options.get("fresh") else CACHE_TTL,
+            stale_ttl=STALE_TTL,
+        )
+    except httpx.HTTPStatusError as e:
+        # Multi-number lookups are not accepted for every service; go one by one
+        if not 400 <= e.response.status_code < 500 or len(batch) == 1:
+            raise
+        return {}
+
+    wanted = set(batch)
+    keep = not response.extensions.get(STALE_EXTENSION)
+    found: Dict[str, TrackingResponse] = {}
+    raw_data = json_loads(response.content)
+    for dhl_shipment in raw_data.get("shipments") or ():
+        sid = str(dhl_shipment.get("id") or "")
+        if sid in wanted and sid not in found:
+            result = flag_stale(
+                TrackingResponse.model_construct(
+                    shipments=[_normalize_dhl_shipment(dhl_shipment, sid)],
+                    provider="dhl",
+                ),
+                response,
+            )
+            if keep:
+                _RESULTS.set(_number_key(sid, language, options), result)
+            found[sid] = result.model_copy(deep=True)
+    return found
 
 
 def normalize_dhl_response(
@@ -398,72 +662,57 @@ def normalize_dhl_response(
     shipments: list[Shipment] = []
 
     # Extract shipment data from DHL format
-    shipment_list = raw_data.get("shipments", [])
+    shipment_list = raw_data.get("shipments") or ()
     if not shipment_list:
         # No shipments found
-        return TrackingResponse(shipments=shipments, provider="dhl")
+        return TrackingResponse.model_construct(shipments=shipments, provider="dhl")
+
+    # Take first shipment
+    shipments.append(_normalize_dhl_shipment(shipment_list[0], tracking_number))
 
-    dhl_shipment = shipment_list[0]  # Take first shipment
-    events: list[TrackingEvent] = []
+    return TrackingResponse.model_construct(shipments=shipments, provider="dhl")
+
+
+def _normalize_dhl_shipment(
+    dhl_shipment: Dict[str, Any], tracking_number: str
+) -> Shipment:
+    """Build a Shipment from one UTAPI shipment object.
+
+    Models are built with model_construct (no validation), so payload values
+    are coerced to the model's types first (opt_str() for text fields); keep
+    it that way when adding fields.
+    """
     # Convert events
-    for ev in dhl_shipment.get("events", []):
-        # Parse timestamp
-        timestamp = parse_dt_iso(ev.get("timestamp", "")) or datetime.now()
-
-        # Choose human-readable status and details
-        status_text, details_text = _select_event_text(ev)
-
-        # Build location string (prefer locality,country; fallback to servicePoint label)
-        location = None
-        loc_addr = (ev.get("location") or {}).get("address") or {}
-        locality = loc_addr.get("addressLocality")
-        country = loc_addr.get("countryCode")
-        if locality and country:
-            location = f"{locality}, {country}"
-        elif locality:
-            location = locality
-        else:
-            sp = (ev.get("location") or {}).get("servicePoint") or {}
-            label = sp.get("label")
-            if label:
-                location = label
-
-        tracking_event = TrackingEvent(
-            timestamp=timestamp,
-            status=status_text,
-            location=location,
-            details=details_text,
-            status_code=(ev.get("statusCode") or None),
-            extras=None,
-        )
-        events.append(tracking_event)
+    events = [_dhl_event(ev) for ev in dhl_shipment.get("events") or ()]
 
     # Sort events for consistency (ascending time)
-    events.sort(key=lambda e: e.timestamp)
+    events.sort(key=attrgetter("timestamp"))
 
     # Determine overall shipment status (prefer shipment.status.statusCode)
     status = _infer_dhl_status(dhl_shipment, events)
 
     # Extract additional shipment details
-    details = dhl_shipment.get("details", {})
-    service_type = (details.get("product") or {}).get("productName")
+    details = dhl_shipment.get("details", _EMPTY)
+    service_type = opt_str((details.get("product") or _EMPTY).get("productName"))
     # Extract origin and destination
     origin = None
     destination = None
-    if "origin" in details:
-        origin_addr = details["origin"].get("address") or {}
+    origin_info = details.get("origin")
+    if origin_info is not None:
+        origin_addr = origin_info.get("address") or _EMPTY
         origin_locality = origin_addr.get("addressLocality", "")
         origin_country = origin_addr.get("countryCode", "")
         origin = f"{origin_locality}, {origin_country}".strip(", ")
 
-    if "destination" in details:
-        dest_addr = details["destination"].get("address") or {}
+    dest_info = details.get("destination")
+    if dest_info is not None:
+        dest_addr = dest_info.get("address") or _EMPTY
         dest_locality = dest_addr.get("addressLocality", "")
         dest_country = dest_addr.get("countryCode", "")
         destination = f"{dest_locality}, {dest_country}".strip(", ")
 
-    shipment = Shipment(
-        tracking_number=dhl_shipment.get("id", tracking_number),
+    return Shipment.model_construct(
+        tracking_number=str(dhl_shipment.get("id") or tracking_number),
         carrier="dhl",
         status=status,
         events=events,
@@ -475,14 +724,42 @@ def normalize_dhl_response(
         extras=None,
     )
 
-    shipments.append(shipment)
 
-    return TrackingResponse(shipments=shipments, provider="dhl")
+def _dhl_event(ev: Dict[str, Any]) -> TrackingEvent:
+    # Choose human-readable status and details
+    status_text, details_text = _select_event_text(ev)
+    return TrackingEvent.model_construct(
+        timestamp=parse_dt_iso(ev.get("timestamp")) or datetime.now(),
+        status=status_text,
+        location=_event_location(ev),
+        details=details_text,
+        status_code=opt_str(ev.get("statusCode") or None),
+        extras=None,
+    )
+
+
+def _event_location(ev: Dict[str, Any]) -> Optional[str]:
+    """Location string: "locality, country", else the servicePoint label.
+
+    Direct indexing keeps the common all-keys-present path free of the
+    temporary dicts a `.get() or {}` chain creates.
+    """
+    try:
+        locality = ev["location"]["address"]["addressLocality"]
+    except (KeyError, TypeError):
+        locality = None
+    if locality:
+        country = ev["location"]["address"].get("countryCode")
+        return f"{locality}, {country}" if country else str(locality)
+    try:
+        return opt_str(ev["location"]["servicePoint"]["label"] or None)
+    except (KeyError, TypeError):
+        return None
 
 
-def _parse_dhl_timestamp(timestamp_str: str) -> datetime:
-    # Deprecated in favor of utils.parse_dt_iso
-    return parse_dt_iso(timestamp_str) or datetime.now()
+def _says_out_for_delivery(event: TrackingEvent) -> bool:
+    """True if the event text reads as out-for-delivery."""
+    return _OUT_FOR_DELIVERY_RE.search(event.details or event.status or "") is not None
 
 
 def _infer_dhl_status(
@@ -501,23 +778,16 @@ def _infer_dhl_status(
     - Check for phrases like "delivery vehicle" to detect out-for-delivery
     """
     # 1) Shipment-level statusCode is canonical
-    shipment_status_obj = dhl_shipment.get("status") or {}
-    st_code = (shipment_status_obj.get("statusCode") or "").strip()
+    shipment_status_obj = dhl_shipment.get("status") or _EMPTY
+    st_code = str(shipment_status_obj.get("statusCode") or "").strip()
     mapped = _map_utapi_status_code(st_code)
     if mapped != ShipmentStatus.UNKNOWN:
-        # If mapped to IN_TRANSIT but latest event text clearly indicates out-for-delivery
-        if mapped == ShipmentStatus.IN_TRANSIT and events:
-            latest_text = (events[-1].details or events[-1].status or "").lower()
-            if any(
-                phrase in latest_text
-                for phrase in [
-                    "out for delivery",
-                    "in delivery",
-                    "loaded onto the delivery vehicle",
-                    "delivery vehicle",
-                ]
-            ):
-                return ShipmentStatus.OUT_FOR_DELIVERY
+        # Only IN_TRANSIT can be refined; other codes return without text checks
+        if mapped != ShipmentStatus.IN_TRANSIT or not events:
+            return mapped
+        # Latest event text may clearly indicate out-for-delivery
+        if _says_out_for_delivery(events[-1]):
+            return ShipmentStatus.OUT_FOR_DELIVERY
         return mapped
 
     # 2) Fallback: latest event statusCode
@@ -526,18 +796,10 @@ def _infer_dhl_status(
         if latest.status_code:
             mapped = _map_utapi_status_code(latest.status_code)
             if mapped != ShipmentStatus.UNKNOWN:
-                if mapped == ShipmentStatus.IN_TRANSIT:
-                    text = (latest.details or latest.status or "").lower()
-                    if any(
-                        phrase in text
-                        for phrase in [
-                            "out for delivery",
-                            "in delivery",
-                            "loaded onto the delivery vehicle",
-                            "delivery vehicle",
-                        ]
-                    ):
-                        return ShipmentStatus.OUT_FOR_DELIVERY
+                if mapped != ShipmentStatus.IN_TRANSIT:
+                    return mapped
+                if _says_out_for_delivery(latest):
+                    return ShipmentStatus.OUT_FOR_DELIVERY
                 return mapped
 
         # 3) Heuristic based on human-readable text
@@ -4,35 +4,56 @@ DPD provides a REST API for tracking parcels without authentication.
 The API supports multiple locales and returns detailed tracking events.
 """
 
+import re
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
 import httpx
 from urllib.parse import quote
 
+from ..cache import MemoryCache
 from ..models import TrackingResponse, Shipment, TrackingEvent, ShipmentStatus
-from ..utils import get_with_retries, async_get_with_retries
+from ..utils import (
+    get_with_retries,
+    async_get_with_retries,
+    json_loads,
+    parse_dt_iso,
+    gather_bounded,
+    run_async,
+)
 from .base import ProviderBase
 
-
 # DPD Public PLC (Parcel Life Cycle) API endpoint
 # No authentication required - public tracking endpoint
 REST_BASE = "https://tracking.dpd.de/rest/plc"
 
+# Scans arrive minutes to hours apart; repeat polls within this many seconds
+# are answered from cache (fresh=True bypasses it)
+CACHE_TTL = 60.0
+
+# Normalized results per (locale, parcel number), see track()
+_RESULTS = MemoryCache(maxsize=1024, ttl=CACHE_TTL)
+
 # Supported PLC locales (discovered via testing)
 # The API accepts locale codes in format: language_COUNTRY
 # Invalid/unsupported locales fallback to English (en_US)
 # Note: Locale codes are case-sensitive (must be lowercase_UPPERCASE)
-_SUPPORTED_LOCALES = {
-    "en_US",  # English (fallback for invalid locales)
-    "de_DE",  # German
-    "fr_FR",  # French
-    "es_ES",  # Spanish
-    "it_IT",  # Italian (returns English content)
-    "nl_NL",  # Dutch
-    "pl_PL",  # Polish
-    "cs_CZ",  # Czech
-}
+_SUPPORTED_LOCALES = frozenset(
+    {
+        "en_US",  # English (fallback for invalid locales)
+        "de_DE",  # German
+        "fr_FR",  # French
+        "es_ES",  # Spanish
+        "it_IT",  # Italian (returns English content)
+        "nl_NL",  # Dutch
+        "pl_PL",  # Polish
+        "cs_CZ",  # Czech
+    }
+)
 
 # Simple language code to locale mapping
 # Used when user provides 2-letter language codes
@@ -47,8 +68,63 @@ _LANG_TO_LOCALE = {
     "cs": "cs_CZ",
 }
 
+# Lowercased keys that mark a dict as a tracking event (_find_first_events_list)
+_EVENT_KEYS = frozenset(("status", "description", "state"))
+
+# Key substrings that mark a JSON body as a DPD tracking payload
+_HINTS = frozenset(("parcel", "events", "status", "shipment", "tracking"))
+_HINT_MAX_DEPTH = 6
+
+# strptime fallbacks for non-ISO dates (see _parse_dpd_status_date and
+# _coerce_timestamp)
+_STATUS_DATE_FORMATS = ("%d.%m.%Y, %H:%M", "%d.%m.%Y %H:%M")
+_DMY_FORMATS = ("%d/%m/%Y %H:%M", "%d/%m/%Y")
+
+# Status phrases, one named group per phrase family; _status_from() ranks the
+# groups found so a later "delivered" still beats an earlier "delivery". The
+# zero-width lookahead (as in utils._TEXT_STATUS_RE) also finds phrases that
+# overlap an earlier match ("sortedelivered")
+_PLC_STATUS_CODE_RE = re.compile(
+    r"(?=(?P<delivered>DELIVERED)|(?P<out>OUT_FOR_DELIVERY)"
+    r"|(?P<transit>ON_THE_ROAD|AT_DELIVERY_DEPOT|IN_TRANSIT)|(?P<pickup>PICKUP))"
+)
+_PLC_STATUS_CODES = (
+    ("delivered", ShipmentStatus.DELIVERED),
+    ("out", ShipmentStatus.OUT_FOR_DELIVERY),
+    ("transit", ShipmentStatus.IN_TRANSIT),
+    ("pickup", ShipmentStatus.INFORMATION_RECEIVED),
+)
+_STATUS_TEXT_RE = re.compile(
+    r"(?=(?P<delivered>delivered)|(?P<delivery>delivery)|(?P<transit>transit)"
+    r"|(?P<road>depot|on the way)|(?P<sorted>sorted|processed))"
+)
+# Latest PLC scan text, and events found in embedded JSON
+_PLC_STATUS_TEXTS = (
+    ("delivered", ShipmentStatus.DELIVERED),
+    ("delivery", ShipmentStatus.OUT_FOR_DELIVERY),
+    ("transit", ShipmentStatus.IN_TRANSIT),
+    ("road", ShipmentStatus.IN_TRANSIT),
+)
+_EMBEDDED_STATUS_TEXTS = (
+    ("delivered", ShipmentStatus.DELIVERED),
+    ("delivery", ShipmentStatus.OUT_FOR_DELIVERY),
+    ("transit", ShipmentStatus.IN_TRANSIT),
+    ("sorted", ShipmentStatus.IN_TRANSIT),
+)
+
+# Shared read-only default for missing nested objects
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Headers (optional but recommended for clarity)
+_HEADERS = {
+    "User-Agent": "mylittletracker/0.1 (+https://example.com)",  # Optional
+    "Accept": "application/json",  # Optional, API always returns JSON or redirects
+}
+
 
-def track(parcel_number: str, *, language: str = "EN") -> TrackingResponse:
+def track(
+    parcel_number: str, *, language: str = "EN", fresh: bool = False
+) -> TrackingResponse:
     """Retrieve DPD tracking using the public PLC JSON endpoint.
 
     API URL Format: https://tracking.dpd.de/rest/plc/{locale}/{parcelNumber} (GET)
@@ -96,9 +172,15 @@ def track(parcel_number: str, *, language: str = "EN") -> TrackingResponse:
     Server selection:
     - Not applicable - single endpoint only
 
+    Caching:
+    - Results are kept in process for CACHE_TTL seconds and the raw response
+      on disk, revalidated with a conditional GET once expired
+    - fresh=True skips both and always asks the API
+
     Args:
         parcel_number: The DPD tracking number
         language: Language code (2-letter) or locale (language_COUNTRY)
+        fresh: Bypass cached results
 
     Returns:
         TrackingResponse with normalized tracking data
@@ -107,27 +189,45 @@ def track(parcel_number: str, *, language: str = "EN") -> TrackingResponse:
     lang_code = lang_code_raw.strip()
     locale, normalized_from = _resolve_locale(lang_code)
 
-    # Headers (optional but recommended for clarity)
-    # The API returns JSON regardless of Accept header
-    headers = {
-        "User-Agent": "mylittletracker/0.1 (+https://example.com)",  # Optional
-        "Accept": "application/json",  # Optional, API always returns JSON or redirects
-    }
+    key = (locale, parcel_number)
+    if not fresh:
+        cached = _RESULTS.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+    # Make API request (the API returns JSON regardless of Accept header)
+    resp = get_with_retries(
+        f"{REST_BASE}/{locale}/{parcel_number}",
+        headers=_HEADERS,
+        timeout=20.0,
+        cache_ttl=None if fresh else CACHE_TTL,
+    )
+    result = _finish(key, resp, parcel_number, lang_code, normalized_from)
+    return result.model_copy(deep=True)
 
-    # Build API URL with locale and tracking number
-    rest_url = f"{REST_BASE}/{locale}/{parcel_number}"
 
-    # Make API request
-    resp = get_with_retries(rest_url, headers=headers, timeout=20.0)
+def _finish(
+    key: Tuple[str, str],
+    resp: httpx.Response,
+    parcel_number: str,
+    lang_code: str,
+    normalized_from: Optional[str],
+    *,
+    keep: bool = True,
+) -> TrackingResponse:
+    """Normalize a PLC response and keep it in the in-process result cache.
 
+    keep=False (a caller-supplied client) leaves the cache untouched.
+    """
+    locale = key[0]
     # Check response type
     # Invalid tracking numbers cause 302 redirects to HTML pages
     ctype = resp.headers.get("Content-Type", "")
     if "application/json" not in ctype.lower():
         # Not JSON = invalid tracking or redirect
-        return TrackingResponse(shipments=[], provider="dpd")
+        return TrackingResponse.model_construct(shipments=[], provider="dpd")
 
-    plc_data = resp.json()
+    plc_data = json_loads(resp.content)
     try:
         shipment = _normalize_dpd_plc_json(
             plc_data,
@@ -136,19 +236,68 @@ def track(parcel_number: str, *, language: str = "EN") -> TrackingResponse:
             language_input=lang_code,
             normalized_from=normalized_from,
         )
-        return TrackingResponse(shipments=[shipment], provider="dpd")
     except Exception:
         try:
             shipment = _normalize_dpd_embedded(plc_data, parcel_number)
-            return TrackingResponse(shipments=[shipment], provider="dpd")
         except Exception:
-            return TrackingResponse(shipments=[], provider="dpd")
+            return TrackingResponse.model_construct(shipments=[], provider="dpd")
+    result = TrackingResponse.model_construct(shipments=[shipment], provider="dpd")
+    if keep:
+        _RESULTS.set(key, result)
+    return result
 
 
 def _looks_like_dpd_payload(obj: Dict[str, Any]) -> bool:
-    text = str(obj).lower()
-    hints = ["parcel", "events", "status", "shipment", "tracking"]
-    return any(h in text for h in hints)
+    # Scan keys only (no str() of the whole tree); DPD payloads are shallow
+    stack: list[tuple[Any, int]] = [(obj, 0)]
+    while stack:
+        item, depth = stack.pop()
+        if isinstance(item, dict):
+            for k in item:
+                key = str(k).lower()
+                if any(h in key for h in _HINTS):
+                    return True
+            children: Iterable[Any] = item.values()
+        elif isinstance(item, list):
+            children = item
+        else:
+            continue
+        if depth < _HINT_MAX_DEPTH:
+            stack.extend(
+                (v, depth + 1) for v in children if isinstance(v, (dict, list))
+            )
+    return False
+
+
+def _scan_event(ev: Dict[str, Any]) -> TrackingEvent:
+    """Build an event from a PLC scanInfo.scan entry."""
+    sd = ev.get("scanDescription") or _EMPTY
+    desc = sd.get("content") or ()
+    status_text = (desc[0] if desc else None) or sd.get("label")
+    return TrackingEvent(
+        timestamp=_parse_iso_date(ev.get("date"))
+        or _coerce_timestamp(ev)
+        or datetime.now(),
+        status=status_text or "",
+        location=(ev.get("scanData") or _EMPTY).get("location"),
+        details=status_text,
+        status_code=None,
+        extras=None,
+    )
+
+
+def _status_event(st: Dict[str, Any]) -> TrackingEvent:
+    """Build an event from a PLC statusInfo milestone."""
+    desc = (st.get("description") or _EMPTY).get("content") or ()
+    status_text = (desc[0] if desc else None) or st.get("label") or st.get("status")
+    return TrackingEvent(
+        timestamp=_parse_dpd_status_date(st.get("date")) or datetime.now(),
+        status=status_text or "",
+        location=st.get("location"),
+        details=status_text,
+        status_code=None,
+        extras=None,
+    )
 
 
 def _normalize_dpd_plc_json(
@@ -184,79 +333,35 @@ def _normalize_dpd_plc_json(
     - scanDescription.content: Array with scan description text
     - scanType.name: Type of scan event
     """
-    plc = obj.get("parcellifecycleResponse", {}).get("parcelLifeCycleData", {})
-    shipment_info = plc.get("shipmentInfo", {})
-    status_info = plc.get("statusInfo", []) or []
-    scan_info = (plc.get("scanInfo", {}) or {}).get("scan", []) or []
-
-    events: list[TrackingEvent] = []
+    plc = obj.get("parcellifecycleResponse", _EMPTY).get("parcelLifeCycleData", _EMPTY)
+    shipment_info = plc.get("shipmentInfo", _EMPTY)
+    status_info = plc.get("statusInfo") or ()
+    scan_info = (plc.get("scanInfo") or _EMPTY).get("scan") or ()
 
     # Prefer scan events for detailed timeline
     if scan_info:
-        for ev in scan_info:
-            ts = _parse_iso_date(ev.get("date")) or _coerce_timestamp(ev)
-            desc = (ev.get("scanDescription", {}) or {}).get("content", [])
-            status_text = (desc[0] if desc else None) or (
-                ev.get("scanDescription", {}) or {}
-            ).get("label")
-            location = (ev.get("scanData", {}) or {}).get("location")
-            events.append(
-                TrackingEvent(
-                    timestamp=ts or datetime.now(),
-                    status=status_text or "",
-                    location=location,
-                    details=status_text,
-                    status_code=None,
-                    extras=None,
-                )
-            )
-    # Fallback to statusInfo milestones
+        events = [_scan_event(ev) for ev in scan_info]
+    # Fallback to statusInfo milestones, only reached ones (no future milestones)
     elif status_info:
-        for st in status_info:
-            # Only include reached statuses to avoid future milestones
-            if not st.get("statusHasBeenReached"):
-                continue
-            ts = _parse_dpd_status_date(st.get("date"))
-            desc = (st.get("description", {}) or {}).get("content", [])
-            status_text = (
-                (desc[0] if desc else None) or st.get("label") or st.get("status")
-            )
-            location = st.get("location")
-            events.append(
-                TrackingEvent(
-                    timestamp=ts or datetime.now(),
-                    status=status_text or "",
-                    location=location,
-                    details=status_text,
-                    status_code=None,
-                    extras=None,
-                )
-            )
+        events = [
+            _status_event(st) for st in status_info if st.get("statusHasBeenReached")
+        ]
+    else:
+        events = []
 
     # Sort events by timestamp for consistency
-    events.sort(key=lambda e: e.timestamp)
+    events.sort(key=attrgetter("timestamp"))
 
     # Determine shipment status using current status or latest event
     status_enum = ShipmentStatus.UNKNOWN
     current = next((s for s in status_info if s.get("isCurrentStatus")), None)
     if current:
-        cur = (current.get("status") or "").upper()
-        if "DELIVERED" in cur:
-            status_enum = ShipmentStatus.DELIVERED
-        elif "OUT_FOR_DELIVERY" in cur:
-            status_enum = ShipmentStatus.OUT_FOR_DELIVERY
-        elif "ON_THE_ROAD" in cur or "AT_DELIVERY_DEPOT" in cur or "IN_TRANSIT" in cur:
-            status_enum = ShipmentStatus.IN_TRANSIT
-        elif "PICKUP" in cur:
-            status_enum = ShipmentStatus.INFORMATION_RECEIVED
+        code = (current.get("status") or "").upper()
+        status_enum = _status_from(_PLC_STATUS_CODE_RE, code, _PLC_STATUS_CODES)
     elif events:
-        last = (events[-1].status or "").lower()
-        if "delivered" in last:
-            status_enum = ShipmentStatus.DELIVERED
-        elif "out for delivery" in last or "delivery" in last:
-            status_enum = ShipmentStatus.OUT_FOR_DELIVERY
-        elif "transit" in last or "depot" in last or "on the way" in last:
-            status_enum = ShipmentStatus.IN_TRANSIT
+        status_enum = _status_from(
+            _STATUS_TEXT_RE, (events[-1].status or "").lower(), _PLC_STATUS_TEXTS
+        )
 
     tracking_number = shipment_info.get("parcelLabelNumber") or parcel_number
 
@@ -286,6 +391,19 @@ def _normalize_dpd_plc_json(
     )
 
 
+def _status_from(
+    pattern: "re.Pattern[str]",
+    text: str,
+    ranking: Tuple[Tuple[str, ShipmentStatus], ...],
+) -> ShipmentStatus:
+    """First status in ranking whose group matches text, in one regex pass."""
+    found = {m.lastgroup for m in pattern.finditer(text)}
+    for group, status in ranking:
+        if group in found:
+            return status
+    return ShipmentStatus.UNKNOWN
+
+
 def _normalize_dpd_embedded(obj: Dict[str, Any], parcel_number: str) -> Shipment:
     """Generic fallback normalizer for unknown embedded JSON structures."""
     events = _find_first_events_list(obj)
@@ -308,13 +426,9 @@ def _normalize_dpd_embedded(obj: Dict[str, Any], parcel_number: str) -> Shipment
 
     status_enum = ShipmentStatus.UNKNOWN
     if tracking_events:
-        last = tracking_events[-1].status.lower()
-        if "delivered" in last:
-            status_enum = ShipmentStatus.DELIVERED
-        elif "delivery" in last:
-            status_enum = ShipmentStatus.OUT_FOR_DELIVERY
-        elif "transit" in last or "sorted" in last or "processed" in last:
-            status_enum = ShipmentStatus.IN_TRANSIT
+        status_enum = _status_from(
+            _STATUS_TEXT_RE, tracking_events[-1].status.lower(), _EMBEDDED_STATUS_TEXTS
+        )
 
     return Shipment(
         tracking_number=parcel_number,
@@ -332,21 +446,19 @@ def _normalize_dpd_embedded(obj: Dict[str, Any], parcel_number: str) -> Shipment
 
 def _find_first_events_list(obj: Dict[str, Any]) -> list[Dict[str, Any]]:
     # BFS through nested structures to locate a list of event-like dicts
-    queue: list[Any] = [obj]
+    queue: deque[Any] = deque([obj])
     while queue:
-        item = queue.pop(0)
+        item = queue.popleft()
         if isinstance(item, dict):
             for v in item.values():
                 if isinstance(v, list) and v and all(isinstance(x, dict) for x in v):
-                    # Check if dicts look like events
-                    keys = set().union(*(x.keys() for x in v))
-                    if any(
-                        k.lower() in ("status", "description", "state") for k in keys
-                    ):
+                    # Check if dicts look like events; stop at the first hit
+                    if any(k.lower() in _EVENT_KEYS for x in v for k in x):
                         return v  # best guess
-                queue.append(v)
+                if isinstance(v, (dict, list)):
+                    queue.append(v)
         elif isinstance(item, list):
-            queue.extend(item)
+            queue.extend(x for x in item if isinstance(x, (dict, list)))
     return []
 
 
@@ -355,6 +467,7 @@ async def track_async(
     *,
     language: str = "EN",
     client: Optional[httpx.AsyncClient] = None,
+    fresh: bool = False,
 ) -> TrackingResponse:
     """Async version using the public PLC JSON endpoint.
 
@@ -364,32 +477,54 @@ async def track_async(
     lang_code = lang_code_raw.strip()
     locale, normalized_from = _resolve_locale(lang_code)
 
-    # Headers (same as sync version)
-    headers = {
-        "User-Agent": "mylittletracker/0.1 (+https://example.com)",  # Optional
-        "Accept": "application/json",  # Optional, API always returns JSON or redirects
-    }
-    rest_url = f"{REST_BASE}/{locale}/{parcel_number}"
+    key = (locale, parcel_number)
+    # A caller-supplied client always sees the request, as in utils
+    if not fresh and client is None:
+        cached = _RESULTS.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
 
     resp = await async_get_with_retries(
-        rest_url, headers=headers, timeout=20.0, client=client
+        f"{REST_BASE}/{locale}/{parcel_number}",
+        headers=_HEADERS,
+        timeout=20.0,
+        client=client,
+        cache_ttl=None if fresh else CACHE_TTL,
+    )
+    result = _finish(
+        key, resp, parcel_number, lang_code, normalized_from, keep=client is None
+    )
+    return result.model_copy(deep=True)
+
+
+async def track_many_async(
+    parcel_numbers: Iterable[str],
+    *,
+    language: str = "EN",
+    client: Optional[httpx.AsyncClient] = None,
+    concurrency: int = 8,
+) -> list[TrackingResponse]:
+    """Track several parcels concurrently over one connection pool.
+
+    At most `concurrency` requests are in flight at once. Results are returned
+    in the order of `parcel_numbers`; the first failure propagates.
+    """
+    return await gather_bounded(
+        lambda n: track_async(n, language=language, client=client),
+        parcel_numbers,
+        concurrency,
     )
-    ctype = resp.headers.get("Content-Type", "")
-    if "application/json" not in ctype.lower():
-        return TrackingResponse(shipments=[], provider="dpd")
 
-    data = resp.json()
-    try:
-        shipment = _normalize_dpd_plc_json(
-            data,
-            parcel_number,
-            locale=locale,
-            language_input=lang_code,
-            normalized_from=normalized_from,
-        )
-    except Exception:
-        shipment = _normalize_dpd_embedded(data, parcel_number)
-    return TrackingResponse(shipments=[shipment], provider="dpd")
+
+def track_many(
+    parcel_numbers: Iterable[str], *, language: str = "EN"
+) -> list[TrackingResponse]:
+    """Synchronous wrapper around track_many_async().
+
+    Raises RuntimeError inside a running event loop; await track_many_async()
+    there instead.
+    """
+    return run_async(track_many_async(parcel_numbers, language=language))
 
 
 def build_tracking_url(parcel_number: str, *, language: str = "EN") -> Optional[str]:
@@ -404,6 +539,8 @@ def build_tracking_url(parcel_number: str, *, language: str = "EN") -> Optional[
     return f"https://tracking.dpd.de/status/{locale}/parcel/{quote(parcel_number)}"
 
 
+# Callers pass a handful of distinct codes; results are immutable tuples
+@lru_cache(maxsize=64)
 def _resolve_locale(lang_code: str) -> Tuple[str, Optional[str]]:
     """Resolve an input language or locale to a supported PLC locale.
 
@@ -468,7 +605,11 @@ class DPDProvider(ProviderBase):
     def track(
         self, tracking_number: str, *, language: str = "EN", **kwargs: Any
     ) -> TrackingResponse:
-        return track(parcel_number=tracking_number, language=language)
+        return track(
+            parcel_number=tracking_number,
+            language=language,
+            fresh=kwargs.get("fresh", False),
+        )
 
     async def track_async(
         self,
@@ -479,24 +620,28 @@ class DPDProvider(ProviderBase):
         **kwargs: Any,
     ) -> TrackingResponse:
         return await track_async(
-            parcel_number=tracking_number, language=language, client=client
+            parcel_number=tracking_number,
+            language=language,
+            client=client,
+            fresh=kwargs.get("fresh", False),
         )
 
 
 def _parse_iso_date(s: Optional[str]) -> Optional[datetime]:
-    if not s:
+    # 2025-09-08T17:01:42, or with Z/offset; ciso8601-backed when installed
+    if not isinstance(s, str):
         return None
-    try:
-        # 2025-09-08T17:01:42
-        return datetime.strptime(s, "%Y-%m-%dT%H:%M:%S")
-    except Exception:
-        try:
-            # 2025-09-08T17:01:42Z or with timezone
-            return datetime.fromisoformat(s.replace("Z", "+00:00"))
-        except Exception:
-            return None
+    return _parse_iso_str(s)
 
 
+# Date parsers below are cached: scans of one parcel often share a timestamp,
+# and datetimes are immutable
+@lru_cache(maxsize=1024)
+def _parse_iso_str(s: str) -> Optional[datetime]:
+    return parse_dt_iso(s)
+
+
+@lru_cache(maxsize=1024)
 def _parse_dpd_status_date(s: Optional[str]) -> Optional[datetime]:
     """Parse DPD status date format.
 
@@ -508,7 +653,7 @@ def _parse_dpd_status_date(s: Optional[str]) -> Optional[datetime]:
     """
     if not s:
         return None
-    for fmt in ("%d.%m.%Y, %H:%M", "%d.%m.%Y %H:%M"):
+    for fmt in _STATUS_DATE_FORMATS:
         try:
             return datetime.strptime(s, fmt)
         except Exception:
@@ -530,16 +675,23 @@ def _coerce_timestamp(ev: Dict[str, Any]) -> Optional[datetime]:
             except Exception:
                 continue
         if isinstance(val, str):
-            for fmt in (
-                "%Y-%m-%dT%H:%M:%S%z",
-                "%Y-%m-%dT%H:%M:%S",
-                "%d/%m/%Y %H:%M",
-                "%d/%m/%Y",
-            ):
-                try:
-                    return datetime.strptime(val, fmt)
-                except Exception:
-                    continue
+            ts = _parse_coerce_str(val)
+            if ts is not None:
+                return ts
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_coerce_str(val: str) -> Optional[datetime]:
+    # ISO strings take the C fast path (ciso8601/fromisoformat)
+    ts = _parse_iso_str(val)
+    if ts is not None:
+        return ts
+    for fmt in _DMY_FORMATS:
+        try:
+            return datetime.strptime(val, fmt)
+        except Exception:
+            continue
     return None
 
 
@@ -14,7 +14,7 @@ from urllib.parse import quote
 import httpx
 
 from ..models import TrackingResponse, Shipment, TrackingEvent, ShipmentStatus
-from ..utils import get_with_retries, async_get_with_retries
+from ..utils import get_with_retries, async_get_with_retries, json_loads
 from .base import ProviderBase
 
 # Ecoscooting/Cainiao API Constants (discovered via reverse engineering)
@@ -123,7 +123,7 @@ def _call_cainiao_api(tracking_number: str) -> Dict[str, Any]:
         )
 
         if response.status_code == 200:
-            return response.json()
+            return json_loads(response.content)
         else:
             raise RuntimeError(f"API returned status {response.status_code}")
     except Exception as e:
@@ -246,7 +246,9 @@ def track(tracking_number: str, *, language: str = "en") -> TrackingResponse:
         if events and shipment_status == ShipmentStatus.DELIVERED:
             shipment.actual_delivery = events[0].timestamp
 
-        return TrackingResponse(shipments=[shipment], provider="ecoscooting")
+        return TrackingResponse.model_construct(
+            shipments=[shipment], provider="ecoscooting"
+        )
 
     except Exception as e:
         # Return error response
@@ -278,19 +280,20 @@ def track(tracking_number: str, *, language: str = "en") -> TrackingResponse:
         )
 
 
-async def atrack(tracking_number: str) -> TrackingResponse:
+async def atrack(
+    tracking_number: str, *, client: Optional[httpx.AsyncClient] = None
+) -> TrackingResponse:
     """
     Async version of track() for Ecoscooting shipments.
 
     Args:
         tracking_number: The tracking number to look up
+        client: AsyncClient to send the request on (default: shared pool)
 
     Returns:
         TrackingResponse with normalized tracking data
     """
     try:
-        # For async version, we'll need to use sync API for now
-        # TODO: Implement proper async version with httpx.AsyncClient
         import json
 
         url = "https://de-link.cainiao.com/gateway/link.do"
@@ -316,13 +319,13 @@ async def atrack(tracking_number: str) -> TrackingResponse:
         }
 
         response = await async_get_with_retries(
-            url, method="POST", data=data, headers=headers
+            url, method="POST", data=data, headers=headers, client=client
         )
 
         if response.status_code != 200:
             raise RuntimeError(f"API returned status {response.status_code}")
 
-        api_data = response.json()
+        api_data = json_loads(response.content)
 
         # Check if the API call was successful
         if api_data.get("success") != "true":
@@ -391,7 +394,9 @@ async def atrack(tracking_number: str) -> TrackingResponse:
         if events and shipment_status == ShipmentStatus.DELIVERED:
             shipment.actual_delivery = events[0].timestamp
 
-        return TrackingResponse(shipments=[shipment], provider="ecoscooting")
+        return TrackingResponse.model_construct(
+            shipments=[shipment], provider="ecoscooting"
+        )
 
     except Exception as e:
         # Return error response
@@ -452,4 +457,4 @@ class EcoscootingProvider(ProviderBase):
         **kwargs: Any,
     ) -> TrackingResponse:
         # Delegate to existing async function name (atrack)
-        return await atrack(tracking_number)
+        return await atrack(tracking_number, client=client)
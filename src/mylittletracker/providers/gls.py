@@ -1,12 +1,25 @@
 import os
 from datetime import datetime
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 import httpx
 from urllib.parse import quote
 
-from ..models import TrackingResponse, Shipment, TrackingEvent, ShipmentStatus
-from ..utils import parse_dt_iso, get_with_retries, async_get_with_retries
+from ..models import (
+    TrackingResponse,
+    Shipment,
+    TrackingEvent,
+    ShipmentStatus,
+    event_list_adapter,
+)
+from ..utils import (
+    parse_dt_iso,
+    get_with_retries,
+    async_get_with_retries,
+    get_shared_client,
+    json_loads,
+)
 from .base import ProviderBase
 
 # Base URLs from the provided GLS OpenAPI spec
@@ -39,29 +52,27 @@ def _get_oauth_token(client_id: str, client_secret: str) -> str:
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
     # Many OAuth servers accept client auth via Basic and/or form fields. Prefer Basic.
     auth = (client_id, client_secret)
-    with httpx.Client(timeout=20.0) as client:
-        resp = client.post(TOKEN_URL, data=data, headers=headers, auth=auth)
-        resp.raise_for_status()
-        payload = resp.json()
-        token = payload.get("access_token")
-        if not token:
-            raise RuntimeError("Failed to obtain GLS access_token")
-        return token
-
-
-def track(
+    # Pooled client: the tracking request that follows reuses the connection
+    resp = get_shared_client().post(
+        TOKEN_URL, data=data, headers=headers, auth=auth, timeout=20.0
+    )
+    resp.raise_for_status()
+    payload = json_loads(resp.content)
+    token = payload.get("access_token")
+    if not token:
+        raise RuntimeError("Failed to obtain GLS access_token")
+    return token
+
+
+def _prepare_request(
     reference: str,
     *,
-    language: str = "EN",
-    server: Optional[str] = None,
-    show_links: bool = False,
-    show_events: bool = True,
-) -> TrackingResponse:
-    """Fetch tracking info for GLS by reference or unitno (parcel number).
-
-    Requires GLS_CLIENT_ID/GLS_CLIENT_SECRET to be set in the environment.
-    Uses /tracking/simple/references/{references} with up to 10 references.
-    """
+    language: str,
+    server: Optional[str],
+    show_links: bool,
+    show_events: bool,
+) -> tuple[str, Dict[str, str], Dict[str, str]]:
+    """Return (url, headers, params) for a GLS references lookup."""
     client_id = os.getenv("GLS_CLIENT_ID")
     client_secret = os.getenv("GLS_CLIENT_SECRET")
     if not client_id or not client_secret:
@@ -87,8 +98,32 @@ def track(
         "showEvents": str(show_events).lower(),
     }
 
+    return url, headers, params
+
+
+def track(
+    reference: str,
+    *,
+    language: str = "EN",
+    server: Optional[str] = None,
+    show_links: bool = False,
+    show_events: bool = True,
+) -> TrackingResponse:
+    """Fetch tracking info for GLS by reference or unitno (parcel number).
+
+    Requires GLS_CLIENT_ID/GLS_CLIENT_SECRET to be set in the environment.
+    Uses /tracking/simple/references/{references} with up to 10 references.
+    """
+    url, headers, params = _prepare_request(
+        reference,
+        language=language,
+        server=server,
+        show_links=show_links,
+        show_events=show_events,
+    )
+
     resp = get_with_retries(url, headers=headers, params=params, timeout=20.0)
-    raw = resp.json()
+    raw = json_loads(resp.content)
 
     return normalize_gls_parcels_response(raw)
 
@@ -103,40 +138,18 @@ async def track_async(
     client: Optional[httpx.AsyncClient] = None,
 ) -> TrackingResponse:
     """Async version for GLS tracking by reference or unitno."""
-    client_id = os.getenv("GLS_CLIENT_ID")
-    client_secret = os.getenv("GLS_CLIENT_SECRET")
-    if not client_id or not client_secret:
-        raise RuntimeError(
-            "GLS_CLIENT_ID/GLS_CLIENT_SECRET are not set. Add them to your environment or .env file."
-        )
-
-    token = _get_oauth_token(client_id, client_secret)
-    base = _server_base(server)
-
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/json",
-        "User-Agent": "mylittletracker/0.1 (+https://example.com)",
-        "Accept-Language": (language or "EN").upper(),
-    }
-
-    references = reference
-    url = f"{base}tracking/simple/references/{references}"
-    params = {
-        "showLinks": str(show_links).lower(),
-        "showEvents": str(show_events).lower(),
-    }
-
-    if client is None:
-        # Reuse async helper without persistent client
-        resp = await async_get_with_retries(
-            url, headers=headers, params=params, timeout=20.0
-        )
-    else:
-        resp = await async_get_with_retries(
-            url, headers=headers, params=params, timeout=20.0, client=client
-        )
-    raw = resp.json()
+    url, headers, params = _prepare_request(
+        reference,
+        language=language,
+        server=server,
+        show_links=show_links,
+        show_events=show_events,
+    )
+
+    resp = await async_get_with_retries(
+        url, headers=headers, params=params, timeout=20.0, client=client
+    )
+    raw = json_loads(resp.content)
 
     return normalize_gls_parcels_response(raw)
 
@@ -174,26 +187,27 @@ def normalize_gls_parcels_response(raw: Dict[str, Any]) -> TrackingResponse:
         status_enum = _map_gls_status((p.get("status") or "").upper())
 
         # Build events
-        events: List[TrackingEvent] = []
+        # Collected as plain dicts and validated in one pass below
+        event_dicts: List[Dict[str, Any]] = []
         for ev in p.get("events", []) or []:
             ts = parse_dt_iso(ev.get("eventDateTime")) or datetime.now()
             desc = ev.get("description") or ev.get("code") or ""
             loc = _compose_location(
                 ev.get("city"), ev.get("postalCode"), ev.get("country")
             )
-            events.append(
-                TrackingEvent(
-                    timestamp=ts,
-                    status=desc,
-                    location=loc,
-                    details=desc,
-                    status_code=ev.get("code"),
-                    extras=None,
-                )
+            event_dicts.append(
+                {
+                    "timestamp": ts,
+                    "status": desc,
+                    "location": loc,
+                    "details": desc,
+                    "status_code": ev.get("code"),
+                    "extras": None,
+                }
             )
-
-        # Sort events for consistency
-        events.sort(key=lambda e: e.timestamp)
+        # Sort events for consistency (on the plain dicts, before validation)
+        event_dicts.sort(key=itemgetter("timestamp"))
+        events: List[TrackingEvent] = event_list_adapter().validate_python(event_dicts)
 
         shipment = Shipment(
             tracking_number=unitno,
@@ -209,7 +223,7 @@ def normalize_gls_parcels_response(raw: Dict[str, Any]) -> TrackingResponse:
         )
         shipments.append(shipment)
 
-    return TrackingResponse(shipments=shipments, provider="gls")
+    return TrackingResponse.model_construct(shipments=shipments, provider="gls")
 
 
 def _compose_location(
@@ -1,30 +1,71 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Optional, Iterable, Any
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Mapping,
+    Optional,
+    TypeVar,
+)
 import time
 import asyncio
+import atexit
+import contextlib
+import contextvars
+import importlib.util
+import json as _json
+import math
 import os
+import random
+import re
+import threading
+from urllib.parse import urlsplit
 
 import httpx
 
-from .models import ShipmentStatus
+try:  # Optional fast JSON decoder (pip install mylittletracker[fast])
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
 
+try:  # Optional C ISO-8601 parser (pip install mylittletracker[fast])
+    from ciso8601 import parse_datetime as _fast_parse_dt
+except ImportError:  # pragma: no cover - depends on environment
+    _fast_parse_dt = None
 
-def to_utc(dt: datetime) -> datetime:
-    """Ensure a datetime is timezone-aware UTC.
+from .cache import ResponseCache, default_cache
 
-    If the datetime is naive (no tzinfo), assume it is UTC and attach tzinfo=UTC.
-    If it is aware, convert to UTC.
+# to_utc/serialize_dt live next to the models (which use them on every dump)
+# and are re-exported here for existing imports.
+from .models import ShipmentStatus, serialize_dt, to_utc  # noqa: F401
+from .models import TrackingResponse
+
+# Response.extensions flag set on responses replayed from an expired entry
+STALE_EXTENSION = "mlt_from_stale_cache"
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode a JSON document, using orjson when installed.
+
+    Raises ValueError on malformed input either way.
     """
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+    if orjson is not None:
+        return orjson.loads(data)
+    return _json.loads(data)
 
 
-def serialize_dt(dt: datetime) -> str:
-    """Serialize datetime as ISO-8601 with trailing 'Z' for UTC."""
-    return to_utc(dt).isoformat().replace("+00:00", "Z")
+def opt_str(value: Any) -> Optional[str]:
+    """str(value), keeping None; for payload values fed to model_construct()."""
+    return str(value) if value is not None else None
 
 
 def parse_dt_iso(s: Optional[str]) -> Optional[datetime]:
@@ -38,8 +79,19 @@ def parse_dt_iso(s: Optional[str]) -> Optional[datetime]:
     """
     if not s:
         return None
+    t = s.strip()
+    if _fast_parse_dt is not None:
+        try:
+            return _fast_parse_dt(t)
+        except ValueError:
+            pass
+    try:
+        # Fast path: canonical ISO strings (and, on Python 3.11+, "Z" and
+        # +HHMM suffixes) parse directly without any string rewriting
+        return datetime.fromisoformat(t)
+    except ValueError:
+        pass
     try:
-        t = s.strip()
         # Replace trailing Z with +00:00
         if t.endswith("Z"):
             t = t[:-1] + "+00:00"
@@ -56,29 +108,301 @@ def parse_dt_iso(s: Optional[str]) -> Optional[datetime]:
     return None
 
 
+# Shared connection pools: repeated requests to a provider host reuse the
+# TCP/TLS connection instead of handshaking on every call.
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0
+)
+_CLIENT_HEADERS = {"User-Agent": "mylittletracker/0.1 (+https://example.com)"}
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2]); only look
+# it up here, httpx imports it when the first client is built
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_client_lock = threading.Lock()
+_sync_client: Optional[httpx.Client] = None
+# Pooled AsyncClient of the enclosing shared_async_client() block, if any
+_scoped_async_client: contextvars.ContextVar[Optional[httpx.AsyncClient]] = (
+    contextvars.ContextVar("mlt_async_client", default=None)
+)
+
+
+def get_shared_client() -> httpx.Client:
+    """Return the process-wide pooled httpx.Client (created on first use)."""
+    global _sync_client
+    if _sync_client is None or _sync_client.is_closed:
+        with _client_lock:
+            if _sync_client is None or _sync_client.is_closed:
+                _sync_client = httpx.Client(
+                    http2=_HTTP2, limits=_CLIENT_LIMITS, headers=_CLIENT_HEADERS
+                )
+    return _sync_client
+
+
+def close_shared_client() -> None:
+    """Close the shared sync client; a new one is created on next use."""
+    global _sync_client
+    with _client_lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+
+
+atexit.register(close_shared_client)
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=_HTTP2, limits=_CLIENT_LIMITS, headers=_CLIENT_HEADERS
+    )
+
+
+@contextlib.asynccontextmanager
+async def shared_async_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Pool connections for the async requests made inside the block.
+
+    Within the block, async_get_with_retries() (and so every track_async())
+    uses one pooled AsyncClient when no client is passed in; it is closed on
+    exit. Outside any block each such request opens and closes its own
+    client, so nothing outlives the event loop. Nested blocks share the
+    outer client.
+    """
+    current = _scoped_async_client.get()
+    if current is not None:
+        yield current
+        return
+    async with _new_async_client() as client:
+        token = _scoped_async_client.set(client)
+        try:
+            yield client
+        finally:
+            _scoped_async_client.reset(token)
+
+
+async def gather_bounded(
+    fn: Callable[[_T], Awaitable[_R]], items: Iterable[_T], concurrency: int
+) -> list[_R]:
+    """Await fn(item) for every item, at most `concurrency` at a time.
+
+    Results are in the order of `items`; the first failure propagates.
+    Requests made without an explicit client share one pooled client (see
+    shared_async_client()).
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(item: _T) -> _R:
+        async with sem:
+            return await fn(item)
+
+    async with shared_async_client():
+        return list(await asyncio.gather(*(one(i) for i in items)))
+
+
+def ensure_no_running_loop(async_name: str) -> None:
+    """Raise RuntimeError pointing at async_name when an event loop is running.
+
+    Sync wrappers that drive their own loop cannot run inside another one.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    raise RuntimeError(
+        "cannot block on a running event loop; "
+        f"await {async_name}() instead of calling its sync wrapper"
+    )
+
+
+def run_async(coro: Coroutine[Any, Any, _R]) -> _R:
+    """asyncio.run() for sync wrappers, inside one shared_async_client() block.
+
+    Raises RuntimeError naming the coroutine function when called from a
+    running event loop (see ensure_no_running_loop()).
+    """
+    try:
+        ensure_no_running_loop(coro.__qualname__)
+    except RuntimeError:
+        coro.close()  # never awaited; avoid the RuntimeWarning
+        raise
+
+    async def main() -> _R:
+        async with shared_async_client():
+            return await coro
+
+    return asyncio.run(main())
+
+
+def _cache_lookup(
+    method: str,
+    url: str,
+    params: Optional[dict],
+    cache_ttl: Optional[float],
+    stale_ttl: Optional[float],
+    client: Optional[Any] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> tuple[
+    Optional[ResponseCache], str, Optional[httpx.Response], Optional[httpx.Response]
+]:
+    """Return (cache, key, fresh, expired) cached responses for a request.
+
+    expired is an entry past cache_ttl that carries an ETag or Last-Modified
+    validator, so the request can be sent as a conditional GET. Requests made
+    with a caller-supplied client are never cached.
+    """
+    if client is not None or not (cache_ttl or stale_ttl) or method.upper() != "GET":
+        return None, "", None, None
+    cache = default_cache()
+    if cache is None:
+        return None, "", None, None
+    key = cache.make_key(method, url, params, headers)
+    fresh = cache.get(key, max_age=cache_ttl) if cache_ttl else None
+    expired = None
+    if fresh is None:
+        expired = cache.get(key, max_age=math.inf, count=False)
+        if expired is not None and not (
+            "etag" in expired.headers or "last-modified" in expired.headers
+        ):
+            expired = None
+    return cache, key, fresh, expired
+
+
+def _conditional_headers(
+    headers: Optional[Mapping[str, str]], expired: Optional[httpx.Response]
+) -> Optional[Mapping[str, str]]:
+    """headers plus If-None-Match/If-Modified-Since from an expired entry."""
+    if expired is None:
+        return headers
+    conditional = dict(headers or {})
+    if "etag" in expired.headers:
+        conditional["If-None-Match"] = expired.headers["etag"]
+    if "last-modified" in expired.headers:
+        conditional["If-Modified-Since"] = expired.headers["last-modified"]
+    return conditional
+
+
+def _stale_fallback(
+    cache: Optional[ResponseCache],
+    key: str,
+    stale_ttl: Optional[float],
+    exc: Optional[httpx.HTTPError],
+) -> Optional[httpx.Response]:
+    """Last good response for key while the upstream fails.
+
+    exc is the final 5xx or transport error, or None when no request was
+    sent because the host's circuit breaker is open.
+    """
+    if cache is None or not stale_ttl:
+        return None
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code < 500:
+        return None
+    resp = cache.get(key, max_age=stale_ttl, count=False)
+    if resp is not None:
+        resp.extensions[STALE_EXTENSION] = True
+    return resp
+
+
+def flag_stale(result: TrackingResponse, resp: httpx.Response) -> TrackingResponse:
+    """Mark shipments built from a stale cached response.
+
+    Sets extras["from_stale_cache"] = True on every shipment when resp was
+    served by the stale_ttl fallback of the retry helpers.
+    """
+    if resp.extensions.get(STALE_EXTENSION):
+        for shipment in result.shipments:
+            shipment.extras = {**(shipment.extras or {}), "from_stale_cache": True}
+    return result
+
+
+# Longest Retry-After we are willing to sleep for before the next attempt
+MAX_RETRY_AFTER = 30.0
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(
+    resp: Optional[httpx.Response], attempt: int, backoff_base: float
+) -> float:
+    """Seconds to wait before the next attempt.
+
+    Uses the server's Retry-After when present (capped at MAX_RETRY_AFTER),
+    else exponential backoff with jitter.
+    """
+    if resp is not None:
+        after = _parse_retry_after(resp.headers.get("retry-after"))
+        if after is not None:
+            return min(after, MAX_RETRY_AFTER)
+    delay = backoff_base * (2 ** (attempt - 1))
+    # Jitter spreads out clients that failed together
+    return delay + random.uniform(0, delay / 2)
+
+
 def get_with_retries(
     url: str,
     *,
     params: Optional[dict] = None,
-    headers: Optional[dict] = None,
+    headers: Optional[Mapping[str, str]] = None,
     timeout: float = 20.0,
     max_attempts: int = 3,
     backoff_base: float = 0.5,
-    status_forcelist: Iterable[int] = (500, 502, 503, 504),
+    status_forcelist: Iterable[int] = (429, 500, 502, 503, 504),
     method: str = "GET",
     data: Optional[Any] = None,
     json: Optional[Any] = None,
+    client: Optional[httpx.Client] = None,
+    cache_ttl: Optional[float] = None,
+    stale_ttl: Optional[float] = None,
 ) -> httpx.Response:
     """HTTP request with simple retries for transient errors.
 
     Supports GET/POST by specifying method; forwards data/json payloads when provided.
+    Between attempts it honours a Retry-After header (e.g. on 429/503),
+    otherwise backs off exponentially with jitter.
+    Uses the shared pooled client unless one is passed in. With cache_ttl, a
+    successful GET is served from the on-disk cache for that many seconds;
+    after that, an entry with an ETag or Last-Modified header is revalidated
+    with a conditional GET and replayed on a 304.
+    With stale_ttl, a GET that finally fails with a 5xx or transport error
+    returns the last good response up to that age instead of raising; such
+    responses carry STALE_EXTENSION in their extensions (see flag_stale()).
+    A caller-supplied client bypasses the cache, so every request goes
+    through it.
+    Requests to a host whose circuit breaker is open (see breaker_for()) are
+    not sent: the stale entry is returned when stale_ttl allows, else
+    ProviderHTTPError is raised.
     """
-    attempt = 0
-    last_exc: Optional[Exception] = None
-    while attempt < max_attempts:
-        attempt += 1
-        try:
-            with httpx.Client(timeout=timeout) as client:
+    cache, cache_key, cached, expired = _cache_lookup(
+        method, url, params, cache_ttl, stale_ttl, client, headers
+    )
+    if cached is not None:
+        return cached
+    headers = _conditional_headers(headers, expired)
+    if client is None:
+        client = get_shared_client()
+    breaker = breaker_for(url)
+    if not breaker.allow():
+        return _breaker_open(url, breaker, cache, cache_key, stale_ttl)
+
+    def send() -> httpx.Response:
+        attempt = 0
+        last_exc: Optional[Exception] = None
+        while attempt < max_attempts:
+            attempt += 1
+            try:
                 resp = client.request(
                     method.upper(),
                     url,
@@ -86,58 +410,106 @@ def get_with_retries(
                     headers=headers,
                     data=data,
                     json=json,
+                    timeout=timeout,
                 )
                 if resp.status_code in status_forcelist and attempt < max_attempts:
-                    time.sleep(backoff_base * (2 ** (attempt - 1)))
+                    time.sleep(_retry_delay(resp, attempt, backoff_base))
                     continue
+                if (
+                    resp.status_code == 304
+                    and cache is not None
+                    and expired is not None
+                ):
+                    # Unchanged upstream: restart the entry's TTL and replay it
+                    cache.set(cache_key, expired)
+                    return expired
                 resp.raise_for_status()
+                if cache is not None and resp.status_code == 200:
+                    cache.set(cache_key, resp)
                 return resp
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code in status_forcelist and attempt < max_attempts:
-                time.sleep(backoff_base * (2 ** (attempt - 1)))
-                continue
-            raise
-        except httpx.HTTPError as e:
-            last_exc = e
-            if attempt < max_attempts:
-                time.sleep(backoff_base * (2 ** (attempt - 1)))
-                continue
-            raise
-    assert last_exc is not None
-    raise last_exc
+            except httpx.HTTPStatusError as e:
+                if (
+                    e.response.status_code in status_forcelist
+                    and attempt < max_attempts
+                ):
+                    time.sleep(_retry_delay(e.response, attempt, backoff_base))
+                    continue
+                stale = _stale_fallback(cache, cache_key, stale_ttl, e)
+                if stale is not None:
+                    return stale
+                raise
+            except httpx.HTTPError as e:
+                last_exc = e
+                if attempt < max_attempts:
+                    time.sleep(_retry_delay(None, attempt, backoff_base))
+                    continue
+                stale = _stale_fallback(cache, cache_key, stale_ttl, e)
+                if stale is not None:
+                    return stale
+                raise
+        assert last_exc is not None
+        raise last_exc
+
+    try:
+        resp = send()
+    except BaseException as exc:
+        _record_outcome(breaker, exc)
+        raise
+    _record_outcome(breaker, None, resp)
+    return resp
 
 
 async def async_get_with_retries(
     url: str,
     *,
     params: Optional[dict] = None,
-    headers: Optional[dict] = None,
+    headers: Optional[Mapping[str, str]] = None,
     timeout: float = 20.0,
     max_attempts: int = 3,
     backoff_base: float = 0.5,
-    status_forcelist: Iterable[int] = (500, 502, 503, 504),
+    status_forcelist: Iterable[int] = (429, 500, 502, 503, 504),
     client: Optional[httpx.AsyncClient] = None,
     method: str = "GET",
     data: Optional[Any] = None,
     json: Optional[Any] = None,
+    cache_ttl: Optional[float] = None,
+    stale_ttl: Optional[float] = None,
 ) -> httpx.Response:
-    """Async HTTP request with simple retries for transient errors."""
-    attempt = 0
-    last_exc: Optional[Exception] = None
-    while attempt < max_attempts:
-        attempt += 1
-        try:
-            if client is None:
-                async with httpx.AsyncClient(timeout=timeout) as ac:
-                    resp = await ac.request(
-                        method.upper(),
-                        url,
-                        params=params,
-                        headers=headers,
-                        data=data,
-                        json=json,
-                    )
-            else:
+    """Async HTTP request with simple retries for transient errors.
+
+    Uses the pooled client of the enclosing shared_async_client() block (or
+    a client for this call only) unless one is passed in; a caller-supplied
+    client keeps its own timeout configuration and, as in
+    get_with_retries(), bypasses the cache. cache_ttl and stale_ttl work as
+    in get_with_retries(), and so does the per-host circuit breaker.
+    """
+    cache, cache_key, cached, expired = _cache_lookup(
+        method, url, params, cache_ttl, stale_ttl, client, headers
+    )
+    if cached is not None:
+        return cached
+    headers = _conditional_headers(headers, expired)
+    req_timeout: Any = timeout
+    owned: Optional[httpx.AsyncClient] = None
+    if client is None:
+        client = _scoped_async_client.get()
+        if client is None:
+            # No shared_async_client() block: use a client for this call only
+            client = owned = _new_async_client()
+    else:
+        req_timeout = httpx.USE_CLIENT_DEFAULT
+    breaker = breaker_for(url)
+    if not breaker.allow():
+        if owned is not None:
+            await owned.aclose()
+        return _breaker_open(url, breaker, cache, cache_key, stale_ttl)
+
+    async def send() -> httpx.Response:
+        attempt = 0
+        last_exc: Optional[Exception] = None
+        while attempt < max_attempts:
+            attempt += 1
+            try:
                 resp = await client.request(
                     method.upper(),
                     url,
@@ -145,64 +517,225 @@ async def async_get_with_retries(
                     headers=headers,
                     data=data,
                     json=json,
+                    timeout=req_timeout,
                 )
-            if resp.status_code in status_forcelist and attempt < max_attempts:
-                await asyncio.sleep(backoff_base * (2 ** (attempt - 1)))
-                continue
-            resp.raise_for_status()
-            return resp
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code in status_forcelist and attempt < max_attempts:
-                await asyncio.sleep(backoff_base * (2 ** (attempt - 1)))
-                continue
-            raise
-        except httpx.HTTPError as e:
-            last_exc = e
-            if attempt < max_attempts:
-                await asyncio.sleep(backoff_base * (2 ** (attempt - 1)))
-                continue
-            raise
-    assert last_exc is not None
-    raise last_exc
+                if resp.status_code in status_forcelist and attempt < max_attempts:
+                    await asyncio.sleep(_retry_delay(resp, attempt, backoff_base))
+                    continue
+                if (
+                    resp.status_code == 304
+                    and cache is not None
+                    and expired is not None
+                ):
+                    # Unchanged upstream: restart the entry's TTL and replay it
+                    cache.set(cache_key, expired)
+                    return expired
+                resp.raise_for_status()
+                if cache is not None and resp.status_code == 200:
+                    cache.set(cache_key, resp)
+                return resp
+            except httpx.HTTPStatusError as e:
+                if (
+                    e.response.status_code in status_forcelist
+                    and attempt < max_attempts
+                ):
+                    await asyncio.sleep(_retry_delay(e.response, attempt, backoff_base))
+                    continue
+                stale = _stale_fallback(cache, cache_key, stale_ttl, e)
+                if stale is not None:
+                    return stale
+                raise
+            except httpx.HTTPError as e:
+                last_exc = e
+                if attempt < max_attempts:
+                    await asyncio.sleep(_retry_delay(None, attempt, backoff_base))
+                    continue
+                stale = _stale_fallback(cache, cache_key, stale_ttl, e)
+                if stale is not None:
+                    return stale
+                raise
+        assert last_exc is not None
+        raise last_exc
+
+    try:
+        resp = await send()
+    except BaseException as exc:
+        _record_outcome(breaker, exc)
+        raise
+    finally:
+        if owned is not None:
+            await owned.aclose()
+    _record_outcome(breaker, None, resp)
+    return resp
+
+
+class CircuitBreaker:
+    """Fail fast while an upstream keeps failing.
+
+    CLOSED: calls pass. After `failure_threshold` consecutive failures the
+    breaker goes OPEN and allow() returns False until `recovery_timeout`
+    seconds have passed; then one trial call is let through (HALF_OPEN).
+    Its success closes the breaker, its failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now."""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def release(self) -> None:
+        """End a call without a verdict (e.g. cancelled); frees the trial slot."""
+        with self._lock:
+            self._trial_running = False
+
+
+# Settings for the per-host breakers used by the retry helpers
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RECOVERY_TIMEOUT = 30.0
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(url: str) -> CircuitBreaker:
+    """The circuit breaker shared by every request to url's host."""
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(
+                BREAKER_FAILURE_THRESHOLD, BREAKER_RECOVERY_TIMEOUT
+            )
+        return breaker
+
+
+def _breaker_open(
+    url: str,
+    breaker: CircuitBreaker,
+    cache: Optional[ResponseCache],
+    cache_key: str,
+    stale_ttl: Optional[float],
+) -> httpx.Response:
+    stale = _stale_fallback(cache, cache_key, stale_ttl, None)
+    if stale is not None:
+        return stale
+    from .providers.base import ProviderHTTPError
+
+    raise ProviderHTTPError(
+        f"{urlsplit(url).netloc}: failing fast after repeated upstream errors; "
+        f"retrying in up to {breaker.recovery_timeout:g}s"
+    )
+
+
+def _record_outcome(
+    breaker: CircuitBreaker,
+    exc: Optional[BaseException],
+    resp: Optional[httpx.Response] = None,
+) -> None:
+    # Client errors (4xx) mean the upstream is reachable; only transport
+    # errors, 5xx and stale fallbacks count towards opening the breaker.
+    if isinstance(exc, httpx.HTTPStatusError):
+        failed = exc.response.status_code >= 500
+    elif isinstance(exc, httpx.HTTPError):
+        failed = True
+    elif exc is not None:
+        # Cancelled or unrelated error: no verdict on the upstream
+        breaker.release()
+        return
+    else:
+        failed = resp is not None and bool(resp.extensions.get(STALE_EXTENSION))
+    if failed:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+# Status phrases in priority order: when several occur, the earliest listed wins
+# (e.g. "available for pickup" before the generic "pickup"). Longer phrases
+# come before their substrings so the regex alternation prefers them.
+_TEXT_STATUS_KEYWORDS: dict[str, ShipmentStatus] = {
+    "available for pickup": ShipmentStatus.AVAILABLE_FOR_PICKUP,
+    "ready for pickup": ShipmentStatus.AVAILABLE_FOR_PICKUP,
+    "disponible para recoger": ShipmentStatus.AVAILABLE_FOR_PICKUP,
+    "para recoger": ShipmentStatus.AVAILABLE_FOR_PICKUP,
+    "pickup point": ShipmentStatus.AVAILABLE_FOR_PICKUP,
+    "collection point": ShipmentStatus.AVAILABLE_FOR_PICKUP,
+    "delivered": ShipmentStatus.DELIVERED,
+    "entregado": ShipmentStatus.DELIVERED,
+    "out for delivery": ShipmentStatus.OUT_FOR_DELIVERY,
+    "in delivery": ShipmentStatus.OUT_FOR_DELIVERY,
+    "reparto": ShipmentStatus.OUT_FOR_DELIVERY,
+    "transit": ShipmentStatus.IN_TRANSIT,
+    "depot": ShipmentStatus.IN_TRANSIT,
+    "sorted": ShipmentStatus.IN_TRANSIT,
+    "on the way": ShipmentStatus.IN_TRANSIT,
+    "pickup": ShipmentStatus.INFORMATION_RECEIVED,
+    "accepted": ShipmentStatus.INFORMATION_RECEIVED,
+    "admitido": ShipmentStatus.INFORMATION_RECEIVED,
+    "pre-registered": ShipmentStatus.INFORMATION_RECEIVED,
+    "pre registered": ShipmentStatus.INFORMATION_RECEIVED,
+    "exception": ShipmentStatus.EXCEPTION,
+    "failed": ShipmentStatus.EXCEPTION,
+    "undeliverable": ShipmentStatus.EXCEPTION,
+}
+_TEXT_STATUS_PRIORITY = {k: i for i, k in enumerate(_TEXT_STATUS_KEYWORDS)}
+# Zero-width lookahead: a match at every position, so overlapping phrases
+# ("acceptedepot") are all seen, as with the plain substring checks
+_TEXT_STATUS_RE = re.compile(
+    "(?=(%s))" % "|".join(map(re.escape, _TEXT_STATUS_KEYWORDS))
+)
 
 
 def map_status_from_text(text: Optional[str]) -> ShipmentStatus:
     if not text:
         return ShipmentStatus.UNKNOWN
-    t = text.lower()
-    # Available for pickup should be checked before generic "pickup"
-    if (
-        "available for pickup" in t
-        or "ready for pickup" in t
-        or "disponible para recoger" in t
-        or "para recoger" in t
-        or "pickup point" in t
-        or "collection point" in t
-    ):
-        return ShipmentStatus.AVAILABLE_FOR_PICKUP
-    if "delivered" in t or "entregado" in t:
-        return ShipmentStatus.DELIVERED
-    if "out for delivery" in t or "in delivery" in t or "reparto" in t:
-        return ShipmentStatus.OUT_FOR_DELIVERY
-    if (
-        "in transit" in t
-        or "transit" in t
-        or "depot" in t
-        or "sorted" in t
-        or "on the way" in t
-    ):
-        return ShipmentStatus.IN_TRANSIT
-    if (
-        "pickup" in t
-        or "accepted" in t
-        or "admitido" in t
-        or "pre-registered" in t
-        or "pre registered" in t
-    ):
-        return ShipmentStatus.INFORMATION_RECEIVED
-    if "exception" in t or "failed" in t or "undeliverable" in t:
-        return ShipmentStatus.EXCEPTION
-    return ShipmentStatus.UNKNOWN
+    # One scan for every phrase; the highest-priority match decides
+    found = _TEXT_STATUS_RE.findall(text.lower())
+    if not found:
+        return ShipmentStatus.UNKNOWN
+    return _TEXT_STATUS_KEYWORDS[min(found, key=_TEXT_STATUS_PRIORITY.__getitem__)]
 
 
 def normalize_language(
@@ -0,0 +1,28 @@
+import pytest
+
+from mylittletracker import utils
+from mylittletracker.providers import dhl, dpd
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch, tmp_path):
+    # Keep mocked responses out of the user's real response cache
+    monkeypatch.setenv("MLT_CACHE_DIR", str(tmp_path / "mlt-cache"))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breakers():
+    # Failures recorded by one test must not open a host's breaker for the next
+    utils._breakers.clear()
+    yield
+    utils._breakers.clear()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_results():
+    # In-process result caches would otherwise make outcomes depend on test order
+    dhl._RESULTS.clear()
+    dpd._RESULTS.clear()
+    yield
+    dhl._RESULTS.clear()
+    dpd._RESULTS.clear()
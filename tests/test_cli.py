@@ -0,0 +1,141 @@
+import json
+from datetime import datetime
+
+import httpx
+
+from mylittletracker import cli
+from mylittletracker.cli import main, print_human
+from mylittletracker.models import (
+    Shipment,
+    ShipmentStatus,
+    TrackingEvent,
+    TrackingResponse,
+)
+
+
+def _sample_response() -> TrackingResponse:
+    return TrackingResponse(
+        provider="correos",
+        shipments=[
+            Shipment(
+                tracking_number="PK43BG0440928440146007C",
+                carrier="correos",
+                status=ShipmentStatus.IN_TRANSIT,
+                destination="Valencia",
+                events=[
+                    TrackingEvent(
+                        timestamp=datetime(2025, 9, 8, 11, 48, 3),
+                        status="Admitido",
+                        details="Envío admitido",
+                    ),
+                    TrackingEvent(
+                        timestamp=datetime(2025, 9, 9, 7, 5),
+                        status="En tránsito",
+                        location="Madrid",
+                    ),
+                ],
+            )
+        ],
+    )
+
+
+def test_print_human_output(capsys):
+    print_human(_sample_response())
+    out = capsys.readouterr().out
+    assert out == (
+        "Provider: correos\n"
+        "\n"
+        "Shipment: PK43BG0440928440146007C\n"
+        "Carrier: correos\n"
+        "Status: in_transit\n"
+        "Destination: Valencia\n"
+        "\n"
+        "Tracking Events:\n"
+        "- 2025-09-08 11:48: Admitido\n"
+        "  Details: Envío admitido\n"
+        "- 2025-09-09 07:05: En tránsito\n"
+        "  Location: Madrid\n"
+    )
+
+
+def test_print_human_no_shipments(capsys):
+    print_human(TrackingResponse(provider="dhl", shipments=[]))
+    assert capsys.readouterr().out == "Provider: dhl\nNo shipments found\n"
+
+
+def test_providers_command(capsys):
+    assert main(["providers"]) == 0
+    names = capsys.readouterr().out.split()
+    assert names == sorted(names)
+    assert "correos" in names and "dpd" in names
+
+
+def test_track_json_output(monkeypatch, capsys):
+    monkeypatch.setattr(
+        cli, "_resolve", lambda carrier: lambda code, language: _sample_response()
+    )
+    assert main(["track", "correos", "PK43BG0440928440146007C", "--json"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["provider"] == "correos"
+    assert payload["shipments"][0]["events"][0]["timestamp"] == "2025-09-08T11:48:03Z"
+
+
+def _status_error(content_type: str, body: bytes) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api.example.test/track")
+    response = httpx.Response(
+        500, headers={"Content-Type": content_type}, content=body, request=request
+    )
+    return httpx.HTTPStatusError("Server error", request=request, response=response)
+
+
+def test_fallback_response_extracts_provider_error():
+    exc = _status_error("application/json", b'{"code": 42, "message": "Not found"}')
+    shipment = cli._fallback_response("dhl", "X1", exc).shipments[0]
+    assert shipment.status == ShipmentStatus.UNKNOWN
+    event = shipment.events[0]
+    assert event.status_code == "500"
+    assert event.extras["provider_error_code"] == "42"
+    assert event.extras["provider_error_description"] == "Not found"
+
+
+def test_fallback_response_bounds_large_bodies():
+    exc = _status_error("application/json", b'{"items": [' + b"1," * 100_000 + b"1]}")
+    event = cli._fallback_response("dhl", "X1", exc).shipments[0].events[0]
+    assert len(event.extras["body_snippet"]) == 500
+
+
+def test_track_multiple_codes_merges_shipments(monkeypatch, capsys):
+    def fake_track(code, language):
+        if code == "BAD":
+            raise RuntimeError("boom")
+        return TrackingResponse(
+            provider="correos",
+            shipments=[
+                Shipment(
+                    tracking_number=code,
+                    carrier="correos",
+                    status=ShipmentStatus.DELIVERED,
+                )
+            ],
+        )
+
+    monkeypatch.setattr(cli, "_resolve", lambda carrier: fake_track)
+    # One failing code falls back to an UNKNOWN shipment and a non-zero exit
+    assert main(["track", "correos", "A1", "BAD", "B2", "--json"]) == 1
+    payload = json.loads(capsys.readouterr().out)
+    numbers = [s["tracking_number"] for s in payload["shipments"]]
+    assert numbers == ["A1", "BAD", "B2"]
+    assert payload["shipments"][1]["status"] == "unknown"
+
+
+def test_track_json_output_to_text_only_stdout(monkeypatch):
+    import contextlib
+    import io
+
+    monkeypatch.setattr(
+        cli, "_resolve", lambda carrier: lambda code, language: _sample_response()
+    )
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        assert main(["track", "correos", "PK43BG0440928440146007C", "--json"]) == 0
+    assert json.loads(buf.getvalue())["provider"] == "correos"
@@ -0,0 +1,115 @@
+from mylittletracker.models import ShipmentStatus
+from mylittletracker.providers.correos import normalize_correos_response
+
+
+def test_correos_parser_basic():
+    raw = {
+        "type": "envio",
+        "expedition": None,
+        "shipment": [
+            {
+                "shipmentCode": "PK43BG0440928440146007C",
+                "events": [
+                    {
+                        "eventDate": "08/09/2025",
+                        "eventTime": "11:48:03",
+                        "summaryText": "Admitido",
+                        "extendedText": None,
+                    },
+                    {
+                        "eventDate": "09/09/2025",
+                        "eventTime": "07:05:00",
+                        "summaryText": "In transit",
+                        "extendedText": "El envío está en tránsito",
+                    },
+                ],
+            }
+        ],
+    }
+
+    res = normalize_correos_response(raw, "PK43BG0440928440146007C")
+    assert res.provider == "correos"
+    assert len(res.shipments) == 1
+    s = res.shipments[0]
+    assert s.tracking_number == "PK43BG0440928440146007C"
+    assert [e.status for e in s.events] == ["Admitido", "In transit"]
+    assert s.status == ShipmentStatus.IN_TRANSIT
+    # Unvalidated models still serialize like validated ones
+    dumped = res.model_dump(mode="json")
+    assert dumped["shipments"][0]["status"] == "in_transit"
+    assert dumped["shipments"][0]["events"][0]["details"] is None
+
+
+def test_correos_parser_no_shipments():
+    res = normalize_correos_response({"shipment": []}, "X1")
+    assert res.provider == "correos"
+    assert res.shipments == []
+
+
+def test_correos_track_many_async_keeps_order():
+    import asyncio
+
+    import httpx
+
+    from mylittletracker.providers import correos
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        code = request.url.params["text"]
+        return httpx.Response(200, json={"shipment": [{"shipmentCode": code}]})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            return await correos.track_many_async(
+                ["A1", "B2", "C3"], client=c, concurrency=2
+            )
+
+    results = asyncio.run(run())
+    assert [r.shipments[0].tracking_number for r in results] == ["A1", "B2", "C3"]
+
+
+def test_correos_status_keyword_priority():
+    from datetime import datetime
+
+    from mylittletracker.models import TrackingEvent
+    from mylittletracker.providers.correos import _infer_correos_status
+
+    def status(text):
+        ev = TrackingEvent(timestamp=datetime(2025, 9, 8), status=text)
+        return _infer_correos_status([ev])
+
+    assert status("Entregado") == ShipmentStatus.DELIVERED
+    # "delivered" outranks "delivery" regardless of position
+    assert status("Delivery attempt; delivered") == ShipmentStatus.DELIVERED
+    assert status("Received in transit") == ShipmentStatus.IN_TRANSIT
+    assert status("Something else") == ShipmentStatus.UNKNOWN
+
+
+def test_correos_datetime_parsing():
+    from datetime import datetime
+
+    from mylittletracker.providers.correos import _parse_correos_datetime
+
+    assert _parse_correos_datetime("08/09/2025", "11:48:03") == datetime(
+        2025, 9, 8, 11, 48, 3
+    )
+    assert _parse_correos_datetime("08/09/2025", "11:48") == datetime(
+        2025, 9, 8, 11, 48
+    )
+    assert _parse_correos_datetime("08/09/2025", "") == datetime(2025, 9, 8)
+    # Unparseable input falls back to "now"
+    before = datetime.now()
+    assert _parse_correos_datetime("2025-09-08", "11:48:03") >= before
+
+
+def test_correos_track_many_rejects_running_loop():
+    import asyncio
+
+    import pytest
+
+    from mylittletracker.providers import correos
+
+    async def run():
+        with pytest.raises(RuntimeError, match="track_many_async"):
+            correos.track_many(["A1", "B2"])
+
+    asyncio.run(run())
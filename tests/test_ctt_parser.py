@@ -82,3 +82,59 @@ def test_ctt_parser_from_sample_json():
     assert any("Entrega" in e.status for e in s.events)
     assert s.origin == "San Fernando de Henares"
     assert s.destination == "Valencia"
+
+
+def test_ctt_status_from_accented_text():
+    from datetime import datetime
+
+    from mylittletracker.models import TrackingEvent
+    from mylittletracker.providers.ctt import _infer_ctt_status
+
+    def status(text):
+        ev = TrackingEvent(timestamp=datetime(2025, 9, 8), status=text)
+        return _infer_ctt_status([ev])
+
+    assert status("Envío ENTREGADO") == ShipmentStatus.DELIVERED
+    assert status("En tránsito") == ShipmentStatus.IN_TRANSIT
+    assert status("Pendiente de recepción en CTT Express") == (
+        ShipmentStatus.INFORMATION_RECEIVED
+    )
+    assert status("Disponible para recoger") == ShipmentStatus.AVAILABLE_FOR_PICKUP
+
+
+def test_ctt_status_phrase_priority():
+    from datetime import datetime
+
+    from mylittletracker.models import TrackingEvent
+    from mylittletracker.providers.ctt import _infer_ctt_status
+
+    ev = TrackingEvent(
+        timestamp=datetime(2025, 9, 8), status="En reparto: entrega realizada"
+    )
+    # Delivered outranks out-for-delivery wherever it appears in the text
+    assert _infer_ctt_status([ev]) == ShipmentStatus.DELIVERED
+
+    # Overlapping phrases are all found, not just the leftmost
+    ev = TrackingEvent(timestamp=datetime(2025, 9, 8), status="Para recogereparto")
+    assert _infer_ctt_status([ev]) == ShipmentStatus.OUT_FOR_DELIVERY
+
+
+def test_ctt_parser_coerces_non_string_payload_values():
+    raw = {
+        "data": {
+            "shipping_code": 82800082909720,
+            "shipping_history": {
+                "events": [
+                    {
+                        "code": 1000,
+                        "description": "En tránsito",
+                        "event_date": "2025-09-08T10:00:00Z",
+                    }
+                ]
+            },
+        }
+    }
+    shipment = normalize_ctt_response(raw, "fallback").shipments[0]
+    assert shipment.tracking_number == "82800082909720"
+    assert shipment.events[0].status_code == "1000"
+    assert shipment.status == ShipmentStatus.IN_TRANSIT
@@ -0,0 +1,236 @@
+from mylittletracker.models import ShipmentStatus
+from mylittletracker.providers.dhl import normalize_dhl_response
+
+
+def test_dhl_parser_basic():
+    raw = {
+        "shipments": [
+            {
+                "id": "7777777770",
+                "service": "express",
+                "status": {"statusCode": "transit", "status": "In transit"},
+                "details": {
+                    "product": {"productName": "DHL Express"},
+                    "origin": {
+                        "address": {"addressLocality": "Leipzig", "countryCode": "DE"}
+                    },
+                    "destination": {"address": {"addressLocality": "Madrid"}},
+                },
+                "events": [
+                    {
+                        "timestamp": "2025-09-09T07:05:00+02:00",
+                        "status": "PO",
+                        "description": "Processed at Madrid",
+                        "statusCode": "transit",
+                        "location": {
+                            "address": {
+                                "addressLocality": "Madrid",
+                                "countryCode": "ES",
+                            }
+                        },
+                    },
+                    {
+                        "timestamp": "2025-09-08T11:48:03+02:00",
+                        "status": "Shipment picked up",
+                        "nextSteps": "Departs origin facility",
+                        "statusCode": "pre-transit",
+                    },
+                ],
+            }
+        ]
+    }
+
+    res = normalize_dhl_response(raw, "7777777770")
+    assert res.provider == "dhl"
+    s = res.shipments[0]
+    assert s.tracking_number == "7777777770"
+    assert s.status == ShipmentStatus.IN_TRANSIT
+    assert s.service_type == "DHL Express"
+    assert s.origin == "Leipzig, DE"
+    assert s.destination == "Madrid"
+    # Chronological order; short status codes are replaced by the description
+    assert [e.status for e in s.events] == ["Shipment picked up", "Processed at Madrid"]
+    assert s.events[0].details == "Next: Departs origin facility"
+    assert s.events[1].location == "Madrid, ES"
+    assert s.events[1].details is None
+
+
+def test_dhl_transit_with_delivery_vehicle_text_is_out_for_delivery():
+    raw = {
+        "shipments": [
+            {
+                "id": "7777777770",
+                "status": {"statusCode": "transit"},
+                "events": [
+                    {
+                        "timestamp": "2025-09-10T08:15:00+02:00",
+                        "description": "Loaded onto the Delivery Vehicle",
+                        "statusCode": "transit",
+                    }
+                ],
+            }
+        ]
+    }
+
+    s = normalize_dhl_response(raw, "7777777770").shipments[0]
+    assert s.status == ShipmentStatus.OUT_FOR_DELIVERY
+
+
+def test_dhl_track_many_uses_one_request(monkeypatch):
+    import httpx
+    import pytest
+
+    from mylittletracker.providers import dhl
+
+    calls, ttls = [], []
+
+    def fake_get(url, *, params, cache_ttl, **kwargs):
+        calls.append(params["trackingNumber"])
+        ttls.append(cache_ttl)
+        shipments = [{"id": n} for n in params["trackingNumber"].split(",")]
+        request = httpx.Request("GET", url)
+        return httpx.Response(200, json={"shipments": shipments}, request=request)
+
+    monkeypatch.setenv("DHL_API_KEY", "test-key")
+    monkeypatch.setattr(dhl, "get_with_retries", fake_get)
+    results = dhl.track_many(["A1", "B2", "A1"])
+    assert calls == ["A1,B2"]
+    assert [r.shipments[0].tracking_number for r in results] == ["A1", "B2", "A1"]
+    # Repeated numbers get independent results, as from track()
+    assert results[2] == results[0] and results[2] is not results[0]
+
+    # Batched results feed track()'s result cache
+    assert dhl.track("B2").shipments[0].tracking_number == "B2"
+    assert calls == ["A1,B2"]
+
+    # Longer lists are split into BATCH_MAX-sized requests
+    calls.clear()
+    monkeypatch.setattr(dhl, "BATCH_MAX", 2)
+    results = dhl.track_many(["A1", "B2", "C3"], fresh=True)
+    assert calls == ["A1,B2", "C3"]
+    assert [r.shipments[0].tracking_number for r in results] == ["A1", "B2", "C3"]
+    assert ttls == [dhl.CACHE_TTL, None, None]
+
+    with pytest.raises(TypeError, match="colour"):
+        dhl.track_many(["A1"], colour="red")
+
+
+def test_dhl_track_many_async_keeps_order(monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from mylittletracker.providers import dhl
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        number = request.url.params["trackingNumber"]
+        return httpx.Response(200, json={"shipments": [{"id": number}]})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            return await dhl.track_many_async(
+                ["A1", "B2", "C3"], client=c, concurrency=2
+            )
+
+    monkeypatch.setenv("DHL_API_KEY", "test-key")
+    monkeypatch.setenv("MLT_NO_CACHE", "1")
+    results = asyncio.run(run())
+    assert [r.shipments[0].tracking_number for r in results] == ["A1", "B2", "C3"]
+
+
+def test_dhl_track_async_coalesces_concurrent_lookups(monkeypatch, tmp_path):
+    import asyncio
+
+    import httpx
+
+    from mylittletracker.providers import dhl
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["trackingNumber"])
+        return httpx.Response(200, json={"shipments": [{"id": "A1"}]})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            first = await asyncio.gather(
+                *(dhl.track_async("A1", client=c) for _ in range(3))
+            )
+            return first, await dhl.track_async("A1", client=c)
+
+    monkeypatch.setenv("DHL_API_KEY", "test-key")
+    monkeypatch.setenv("MLT_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("MLT_NO_CACHE", raising=False)
+    first, again = asyncio.run(run())
+    # A caller-supplied client bypasses the result cache on the later call
+    assert calls == ["A1", "A1"]
+    assert [r.shipments[0].tracking_number for r in first] == ["A1"] * 3
+    # Each concurrent caller gets its own copy of the shared result
+    assert first[0] == first[1] and first[0] is not first[1]
+    assert again.shipments == first[0].shipments
+
+
+def test_dhl_track_many_rejects_running_loop():
+    import asyncio
+
+    import pytest
+
+    from mylittletracker.providers import dhl
+
+    async def run():
+        with pytest.raises(RuntimeError, match="track_many_async"):
+            dhl.track_many(["A1", "B2"])
+
+    asyncio.run(run())
+
+
+def test_dhl_results_are_not_shared_across_keys_or_clients(monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from mylittletracker.providers import dhl
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["DHL-API-Key"])
+        return httpx.Response(200, json={"shipments": [{"id": "A1"}]})
+
+    async def run():
+        async with (
+            httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c1,
+            httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c2,
+        ):
+            # Concurrent lookups through different clients do not coalesce
+            await asyncio.gather(
+                dhl.track_async("A1", client=c1), dhl.track_async("A1", client=c2)
+            )
+            monkeypatch.setenv("DHL_API_KEY", "other-key")
+            await dhl.track_async("A1", client=c1)
+
+    monkeypatch.setenv("DHL_API_KEY", "test-key")
+    asyncio.run(run())
+    assert seen == ["test-key", "test-key", "other-key"]
+
+
+def test_dhl_parser_coerces_null_id_and_numeric_fields():
+    raw = {
+        "shipments": [
+            {
+                "id": None,
+                "status": {"statusCode": 0},
+                "events": [
+                    {
+                        "timestamp": "2025-09-09T07:05:00+02:00",
+                        "status": 42,
+                        "statusCode": "transit",
+                    }
+                ],
+            }
+        ]
+    }
+    shipment = normalize_dhl_response(raw, "7777777770").shipments[0]
+    assert shipment.tracking_number == "7777777770"
+    assert shipment.events[0].status == "42"
+    assert shipment.status == ShipmentStatus.IN_TRANSIT
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+from mylittletracker.providers.dpd import (
+    _coerce_timestamp,
+    _find_first_events_list,
+    _looks_like_dpd_payload,
+    _parse_dpd_status_date,
+)
+
+
+def test_dpd_find_first_events_list_breadth_first():
+    events = [{"Status": "Delivered"}, {"description": "In transit"}]
+    payload = {
+        "meta": {"tags": ["a", "b"], "count": 2},
+        "parcel": {"history": {"deep": [{"state": "too deep"}]}, "scans": events},
+    }
+    assert _find_first_events_list(payload) is events
+    assert _find_first_events_list({"items": [1, 2], "other": {}}) == []
+
+
+def test_dpd_timestamp_formats():
+    assert _parse_dpd_status_date("09.09.2025, 11:19") == datetime(2025, 9, 9, 11, 19)
+    assert _parse_dpd_status_date("bogus") is None
+    ts = _coerce_timestamp({"date": "2025-09-09T11:19:00+0200"})
+    assert ts.utcoffset() == timedelta(hours=2)
+    ts = _coerce_timestamp({"time": "09/09/2025 11:19"})
+    assert ts == datetime(2025, 9, 9, 11, 19)
+    assert _coerce_timestamp({"date": "not a date"}) is None
+
+
+def test_dpd_payload_hint_scans_keys():
+    assert _looks_like_dpd_payload({"a": [{"b": {"ParcelLifeCycleData": {}}}]})
+    assert not _looks_like_dpd_payload({"error": "no parcel found"})
+
+
+def test_dpd_track_caches_results_unless_fresh(monkeypatch, tmp_path):
+    import httpx
+
+    from mylittletracker.providers import dpd
+
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(kwargs["cache_ttl"])
+        body = {"parcellifecycleResponse": {"parcelLifeCycleData": {}}}
+        return httpx.Response(200, json=body, request=httpx.Request("GET", url))
+
+    monkeypatch.setenv("MLT_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("MLT_NO_CACHE", raising=False)
+    monkeypatch.setattr(dpd, "get_with_retries", fake_get)
+    first = dpd.track("01234567890123")
+    again = dpd.track("01234567890123")
+    dpd.track("01234567890123", fresh=True)
+    assert calls == [dpd.CACHE_TTL, None]
+    assert again == first and again is not first
+
+
+def test_dpd_track_async_injected_client_bypasses_results(monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from mylittletracker.providers import dpd
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        body = {"parcellifecycleResponse": {"parcelLifeCycleData": {}}}
+        return httpx.Response(200, json=body)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            await dpd.track_async("01234567890123", client=c)
+            await dpd.track_async("01234567890123", client=c)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+    assert not dpd._RESULTS._data
+
+
+def test_dpd_status_from_ranks_matches():
+    from mylittletracker.models import ShipmentStatus
+    from mylittletracker.providers.dpd import (
+        _EMBEDDED_STATUS_TEXTS,
+        _PLC_STATUS_CODE_RE,
+        _PLC_STATUS_CODES,
+        _PLC_STATUS_TEXTS,
+        _STATUS_TEXT_RE,
+        _status_from,
+    )
+
+    text = "delivery attempt failed, parcel delivered to neighbour"
+    assert _status_from(_STATUS_TEXT_RE, text, _PLC_STATUS_TEXTS) == (
+        ShipmentStatus.DELIVERED
+    )
+    assert _status_from(_STATUS_TEXT_RE, "at depot", _PLC_STATUS_TEXTS) == (
+        ShipmentStatus.IN_TRANSIT
+    )
+    assert _status_from(_STATUS_TEXT_RE, "at depot", _EMBEDDED_STATUS_TEXTS) == (
+        ShipmentStatus.UNKNOWN
+    )
+
+    # Overlapping keywords are all seen, not just the leftmost match
+    assert _status_from(_STATUS_TEXT_RE, "sortedelivered", _EMBEDDED_STATUS_TEXTS) == (
+        ShipmentStatus.DELIVERED
+    )
+    assert _status_from(
+        _PLC_STATUS_CODE_RE, "ON_THE_ROADELIVERED", _PLC_STATUS_CODES
+    ) == (ShipmentStatus.DELIVERED)
@@ -0,0 +1,10 @@
+from datetime import datetime
+
+from mylittletracker.models import TrackingResponse
+
+
+def test_query_timestamp_kept_when_supplied():
+    ts = datetime(2025, 9, 8, 11, 48, 3)
+    resp = TrackingResponse(provider="dhl", shipments=[], query_timestamp=ts)
+    assert resp.query_timestamp is ts
+    assert resp.model_dump(mode="json")["query_timestamp"] == "2025-09-08T11:48:03Z"
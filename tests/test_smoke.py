@@ -6,3 +6,47 @@ def test_imports():
 
     cli = importlib.import_module("mylittletracker.cli")
     assert hasattr(cli, "main")
+
+
+def test_cli_import_does_not_load_httpx():
+    import subprocess
+    import sys
+
+    code = "import sys, mylittletracker.cli; print('httpx' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "False"
+
+
+def test_resolving_one_provider_does_not_import_others():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; from mylittletracker.providers import REGISTRY; "
+        "REGISTRY['correos']; "
+        "print(' '.join(sorted(m for m in sys.modules if '.providers.' in m)))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.split() == [
+        "mylittletracker.providers.base",
+        "mylittletracker.providers.correos",
+    ]
+
+
+def test_correos_tracking_url_does_not_load_httpx():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; from mylittletracker.providers import correos; "
+        "correos.CorreosProvider().build_tracking_url('X1'); "
+        "print('httpx' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "False"
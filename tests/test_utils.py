@@ -0,0 +1,353 @@
+import time
+
+import httpx
+
+from mylittletracker import utils
+
+
+def test_get_with_retries_reuses_client_across_attempts():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(503 if len(calls) == 1 else 200, json={"ok": True})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    resp = utils.get_with_retries(
+        "https://api.example.test/x", client=client, backoff_base=0
+    )
+    assert resp.json() == {"ok": True}
+    assert calls == ["/x", "/x"]
+    assert not client.is_closed
+
+
+def test_shared_client_is_reused():
+    assert utils.get_shared_client() is utils.get_shared_client()
+
+
+def test_get_with_retries_serves_repeat_get_from_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("MLT_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("MLT_NO_CACHE", raising=False)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(200, json={"n": len(calls)})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(utils, "get_shared_client", lambda: client)
+
+    def get(code, **kwargs):
+        return utils.get_with_retries(
+            "https://api.example.test/track",
+            params={"q": code},
+            cache_ttl=300,
+            **kwargs,
+        )
+
+    from mylittletracker.cache import cache_stats
+
+    before = cache_stats()
+    first, again, other = get("A1"), get("A1"), get("B2")
+    after = cache_stats()
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 2
+    assert first.json() == again.json() == {"n": 1}
+    assert again.headers["content-type"] == "application/json"
+    assert other.json() == {"n": 2}
+
+    # Another API key or language is a separate entry
+    assert get("A1", headers={"DHL-API-Key": "other"}).json() == {"n": 3}
+    assert get("A1", headers={"DHL-API-Key": "other"}).json() == {"n": 3}
+
+    # A caller-supplied client always reaches the upstream
+    assert get("A1", client=client).json() == {"n": 4}
+
+    # Disabled via the environment
+    monkeypatch.setenv("MLT_NO_CACHE", "1")
+    assert get("A1").json() == {"n": 5}
+
+
+def test_provider_fails_fast_once_breaker_opens(monkeypatch):
+    import pytest
+
+    from mylittletracker.providers import ctt
+    from mylittletracker.providers.base import ProviderHTTPError
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        raise httpx.ConnectError("down", request=request)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(utils, "get_shared_client", lambda: client)
+    monkeypatch.setattr(utils.time, "sleep", lambda s: None)
+    monkeypatch.setattr(utils, "BREAKER_FAILURE_THRESHOLD", 2)
+
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            ctt.track("X1")
+    assert utils.breaker_for(ctt.BASE_URL).state == utils.CircuitBreaker.OPEN
+    sent = len(calls)
+    with pytest.raises(ProviderHTTPError):
+        ctt.track("X1")
+    assert len(calls) == sent
+
+
+def test_cancelled_trial_releases_breaker():
+    import asyncio
+
+    url = "https://api.example.test/slow"
+    breaker = utils.breaker_for(url)
+    breaker.recovery_timeout = 0.0
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(60)
+        return httpx.Response(200)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            task = asyncio.ensure_future(utils.async_get_with_retries(url, client=c))
+            await asyncio.sleep(0.01)
+            assert not breaker.allow()  # the trial is in flight
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+    assert breaker.allow()
+
+
+def test_async_clients_do_not_outlive_their_block(monkeypatch):
+    import asyncio
+
+    from mylittletracker.providers import ctt
+
+    made = []
+
+    def new_client():
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"data": {}})
+
+        made.append(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        return made[-1]
+
+    monkeypatch.setattr(utils, "_new_async_client", new_client)
+    monkeypatch.setenv("MLT_NO_CACHE", "1")
+
+    # Bare asyncio.run(): each request uses, then closes, its own client
+    asyncio.run(ctt.track_async("A1"))
+    assert len(made) == 1 and made[0].is_closed
+
+    async def pooled():
+        async with utils.shared_async_client():
+            await ctt.track_async("A1")
+            await ctt.track_async("B2")
+
+    asyncio.run(pooled())
+    assert len(made) == 2 and made[1].is_closed
+
+
+def test_json_loads_accepts_bytes_and_rejects_garbage():
+    import pytest
+
+    assert utils.json_loads(b'{"a": [1, "\\u00e9"]}') == {"a": [1, "é"]}
+    with pytest.raises(ValueError):
+        utils.json_loads(b"<html>")
+
+
+def test_circuit_breaker_opens_and_recovers():
+    breaker = utils.CircuitBreaker(failure_threshold=2, recovery_timeout=60.0)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == breaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == breaker.OPEN
+    assert not breaker.allow()
+
+    # Once the cooldown elapses a single trial call is allowed
+    breaker.recovery_timeout = 0.0
+    assert breaker.state == breaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == breaker.CLOSED
+
+
+def test_parse_dt_iso_variants():
+    from datetime import datetime, timedelta, timezone
+
+    utc = timezone.utc
+    assert utils.parse_dt_iso("2025-09-06T14:05:03.399Z") == datetime(
+        2025, 9, 6, 14, 5, 3, 399000, tzinfo=utc
+    )
+    assert utils.parse_dt_iso("2024-10-11T15:24:57+0200") == datetime(
+        2024, 10, 11, 15, 24, 57, tzinfo=timezone(timedelta(hours=2))
+    )
+    assert utils.parse_dt_iso("2025-09-08") == datetime(2025, 9, 8)
+    assert utils.parse_dt_iso("not a date") is None
+    assert utils.parse_dt_iso(None) is None
+
+
+def test_get_with_retries_falls_back_to_stale_entry(monkeypatch, tmp_path):
+    monkeypatch.setenv("MLT_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("MLT_NO_CACHE", raising=False)
+    up = {"ok": True}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if up["ok"]:
+            return httpx.Response(200, json={"state": "fresh"})
+        return httpx.Response(503)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(utils, "get_shared_client", lambda: client)
+
+    def get():
+        return utils.get_with_retries(
+            "https://api.example.test/track",
+            backoff_base=0,
+            cache_ttl=0.001,
+            stale_ttl=3600,
+        )
+
+    assert utils.STALE_EXTENSION not in get().extensions
+    up["ok"] = False
+    time.sleep(0.01)
+    stale = get()
+    assert stale.json() == {"state": "fresh"}
+    assert stale.extensions[utils.STALE_EXTENSION] is True
+
+    from mylittletracker.models import Shipment, ShipmentStatus, TrackingResponse
+
+    result = utils.flag_stale(
+        TrackingResponse(
+            provider="ctt",
+            shipments=[
+                Shipment(
+                    tracking_number="A1",
+                    carrier="ctt",
+                    status=ShipmentStatus.UNKNOWN,
+                )
+            ],
+        ),
+        stale,
+    )
+    assert result.shipments[0].extras == {"from_stale_cache": True}
+
+
+def test_get_with_retries_revalidates_expired_entry(monkeypatch, tmp_path):
+    monkeypatch.setenv("MLT_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("MLT_NO_CACHE", raising=False)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json={"v": 1})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(utils, "get_shared_client", lambda: client)
+
+    def get():
+        return utils.get_with_retries("https://api.example.test/track", cache_ttl=0.001)
+
+    assert get().json() == {"v": 1}
+    time.sleep(0.01)
+    again = get()
+    assert seen == [None, '"v1"']
+    assert again.status_code == 200
+    assert again.json() == {"v": 1}
+
+
+def test_memory_cache_ttl_and_lru(monkeypatch):
+    from mylittletracker.cache import MemoryCache
+
+    monkeypatch.delenv("MLT_NO_CACHE", raising=False)
+    cache = MemoryCache(maxsize=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    cache.ttl = 0.0
+    cache.set("d", 4)
+    assert cache.get("d") is None
+
+    cache.ttl = 60.0
+    cache.set("e", 5)
+    monkeypatch.setenv("MLT_NO_CACHE", "1")
+    assert cache.get("e") is None
+
+
+def test_map_status_from_text_priority():
+    from mylittletracker.models import ShipmentStatus
+
+    assert utils.map_status_from_text("Ready for pickup") == (
+        ShipmentStatus.AVAILABLE_FOR_PICKUP
+    )
+    assert utils.map_status_from_text("Pickup failed, in transit") == (
+        ShipmentStatus.IN_TRANSIT
+    )
+    assert utils.map_status_from_text("Delivery failed") == ShipmentStatus.EXCEPTION
+    assert utils.map_status_from_text("Label printed") == ShipmentStatus.UNKNOWN
+    assert utils.map_status_from_text(None) == ShipmentStatus.UNKNOWN
+
+
+def test_get_with_retries_honours_retry_after(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(utils.time, "sleep", sleeps.append)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "2"})
+        return httpx.Response(200, json={"ok": True})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    resp = utils.get_with_retries("https://api.example.test/x", client=client)
+    assert resp.json() == {"ok": True}
+    assert sleeps == [2.0]
+
+    assert utils._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert utils._parse_retry_after("soon") is None
+
+
+def test_gather_bounded_limits_concurrency_and_keeps_order():
+    import asyncio
+
+    running = {"now": 0, "peak": 0}
+
+    async def work(n):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.001 * (5 - n))
+        running["now"] -= 1
+        return n * 10
+
+    results = asyncio.run(utils.gather_bounded(work, range(5), 2))
+    assert results == [0, 10, 20, 30, 40]
+    assert running["peak"] == 2
+
+
+def test_map_status_from_text_sees_overlapping_phrases():
+    import random
+
+    from mylittletracker.models import ShipmentStatus
+
+    def reference(text):
+        t = text.lower()
+        hits = [k for k in utils._TEXT_STATUS_KEYWORDS if k in t]
+        return utils._TEXT_STATUS_KEYWORDS[hits[0]] if hits else ShipmentStatus.UNKNOWN
+
+    assert utils.map_status_from_text("acceptedepot") == ShipmentStatus.IN_TRANSIT
+    rng = random.Random(0)
+    words = list(utils._TEXT_STATUS_KEYWORDS) + ["x", " "]
+    for _ in range(2000):
+        glued = "".join(rng.choice(words)[rng.randrange(3) :] for _ in range(4))
+        assert utils.map_status_from_text(glued) == reference(glued), glued